@@ -1,12 +1,62 @@
 """Detector de metadatos de Jira para configuración automática."""
 
+import heapq
 import logging
+import re
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
 
 logger = logging.getLogger(__name__)
 
+# Nombres de tipos de issue preferidos, en orden de prioridad
+_STORY_TYPE_CANDIDATES = ("Story", "Historia", "Historia de Usuario", "User Story")
+_SUBTASK_TYPE_CANDIDATES = ("Subtarea", "Sub-task", "Subtask", "Sub-tarea")
+_FEATURE_TYPE_CANDIDATES = ("Feature", "Epic", "Funcionalidad", "Épica")
+
+# Palabras que sugieren un tipo contenedor cuando no hay Feature/Epic
+_CONTAINER_TYPE_WORDS = ("parent", "container", "theme", "initiative")
+
+# Expansión de createmeta que incluye el esquema de campos de cada tipo
+_FIELDS_EXPAND = "projects.issuetypes.fields"
+
+# Valor por defecto de campos obligatorios sin valores permitidos, según schema
+_DEFAULT_FIELD_VALUE = "default_value"
+_SCHEMA_TYPE_DEFAULTS: Dict[str, Any] = {"string": _DEFAULT_FIELD_VALUE, "number": 0}
+
+_CUSTOM_FIELD_PREFIX = "customfield_"
+
+# Tipos de campo que pueden contener texto
+_VALID_CRITERIA_TYPES = frozenset({"string", "any", "doc", "textarea"})
+
+# Palabras clave que indican criterios de aceptación
+_CRITERIA_KEYWORDS_PATTERN = re.compile(
+    r"criteri[ao]|acceptance|aceptaci[oó]n|condition|condici[oó]n"
+    r"|requirement|requisito|test"
+)
+
+# Puntaje de relevancia por grupo de palabras clave
+_CRITERIA_RELEVANCE_SCORES = (
+    (re.compile(r"acceptance|aceptaci[oó]n"), 10),
+    (re.compile(r"criteri[ao]"), 8),
+    (re.compile(r"condition|condici[oó]n"), 5),
+)
+
+
+def _parse_json(response: requests.Response) -> Dict[str, Any]:
+    """Decodifica el cuerpo JSON de la respuesta con orjson.
+
+    Las respuestas de createmeta pueden ocupar varios MB en proyectos grandes,
+    donde orjson decodifica bastante más rápido que el módulo json estándar.
+    """
+    return orjson.loads(response.content)  # pylint: disable=no-member
+
+
+def _cache_key(params: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+    """Clave de cache para una consulta createmeta según sus parámetros."""
+    return tuple(sorted(params.items()))
+
 
 class JiraMetadataDetector:
     """Detector de metadatos para configuración automática de Jira."""
@@ -15,19 +65,50 @@ class JiraMetadataDetector:
         self.session = session
         self.base_url = base_url.rstrip("/")
         self.project_key = project_key
+        # Cache de respuestas createmeta para evitar consultas repetidas:
+        # params de consulta -> respuesta JSON
+        self._createmeta_cache: Dict[Tuple[Tuple[str, str], ...], Dict[str, Any]] = {}
+        # Índice de tipos de issue: nombre en minúsculas -> id
+        self._issue_type_index: Optional[Dict[str, str]] = None
+        # Tipos de issue categorizados por get_available_issue_types
+        self._issue_types_cache: Optional[Dict[str, List[str]]] = None
+
+    def _fetch_createmeta(self, **params: str) -> Dict[str, Any]:
+        """Consulta createmeta del proyecto reutilizando respuestas ya obtenidas.
+
+        Args:
+            **params: Parámetros adicionales a projectKeys (expand, issuetypeNames...)
+
+        Returns:
+            Respuesta JSON de createmeta
+        """
+        cache_key = _cache_key(params)
+        if cache_key in self._createmeta_cache:
+            logger.debug("Usando createmeta cacheado para %s", params)
+            return self._createmeta_cache[cache_key]
+
+        response = self.session.get(
+            f"{self.base_url}/rest/api/3/issue/createmeta",
+            params={"projectKeys": self.project_key, **params},
+        )
+        response.raise_for_status()
+        data = _parse_json(response)
+        self._createmeta_cache[cache_key] = data
+        return data
 
     def get_available_issue_types(self) -> Dict[str, List[str]]:
         """Obtiene los tipos de issue disponibles categorizados.
 
         Returns:
-            Dict con 'standard', 'subtasks', y 'all' como keys
+            Dict con 'standard', 'subtasks', y 'all' como keys; es una copia,
+            por lo que modificarla no altera el cache interno
         """
+        if self._issue_types_cache is not None:
+            return self._copy_issue_types()
+
         try:
-            url = f"{self.base_url}/rest/api/3/issue/createmeta"
-            params = f"projectKeys={self.project_key}&expand=projects.issuetypes"
-            response = self.session.get(f"{url}?{params}")
-            response.raise_for_status()
-            data = response.json()
+            # Sin expand: los tipos de issue vienen incluidos y se evita pedir campos
+            data = self._fetch_createmeta()
 
             if not data.get("projects") or len(data["projects"]) == 0:
                 logger.warning("No se encontraron proyectos en createmeta")
@@ -48,16 +129,24 @@ class JiraMetadataDetector:
                 else:
                     standard_types.append(name)
 
-            return {
+            self._issue_types_cache = {
                 "standard": standard_types,
                 "subtasks": subtask_types,
                 "all": all_types,
             }
+            return self._copy_issue_types()
 
         except Exception as e:
             logger.error("Error obteniendo tipos de issue: %s", str(e))
             return {"standard": [], "subtasks": [], "all": []}
 
+    def _copy_issue_types(self) -> Dict[str, List[str]]:
+        """Copia de los tipos de issue cacheados para entregar a los llamadores."""
+        return {
+            category: list(names)
+            for category, names in self._issue_types_cache.items()
+        }
+
     def detect_acceptance_criteria_fields(self) -> List[Dict[str, str]]:
         """Detecta campos personalizados que podrían ser para criterios de aceptación.
 
@@ -65,21 +154,28 @@ class JiraMetadataDetector:
             Lista de candidatos con 'id', 'name', 'type'
         """
         try:
-            # Obtener metadatos de creación para Story o tipo similar
-            story_types = ["Story", "Historia", "Historia de Usuario", "User Story"]
+            # Consultar solo los tipos tipo Story que existen en el proyecto,
+            # en orden de prioridad, para no pedir createmeta de tipos ausentes.
+            # Si no se pudo obtener el listado de tipos, probar todos los candidatos
+            standard_types = self.get_available_issue_types()["standard"]
+            if standard_types:
+                available = set(standard_types)
+                story_types = [
+                    name for name in _STORY_TYPE_CANDIDATES if name in available
+                ]
+            else:
+                story_types = list(_STORY_TYPE_CANDIDATES)
 
-            for issue_type in story_types:
-                fields = self._get_fields_for_issue_type(issue_type)
+            for story_type in story_types:
+                fields = self._get_fields_for_issue_type(story_type)
                 if fields:
                     candidates = self._filter_criteria_fields(fields)
                     if candidates:
                         return candidates
 
             # Si no encuentra tipos específicos, usar el primer tipo estándar
-            issue_types = self.get_available_issue_types()
-            if issue_types["standard"]:
-                first_type = issue_types["standard"][0]
-                fields = self._get_fields_for_issue_type(first_type)
+            if standard_types and standard_types[0] not in story_types:
+                fields = self._get_fields_for_issue_type(standard_types[0])
                 return self._filter_criteria_fields(fields) if fields else []
 
             return []
@@ -100,16 +196,9 @@ class JiraMetadataDetector:
             Tupla con (required_fields_dict, epic_name_field_id)
         """
         try:
-            response = self.session.get(
-                f"{self.base_url}/rest/api/3/issue/createmeta",
-                params={
-                    "projectKeys": self.project_key,
-                    "issuetypeNames": feature_type,
-                    "expand": "projects.issuetypes.fields",
-                },
+            data = self._fetch_createmeta(
+                issuetypeNames=feature_type, expand=_FIELDS_EXPAND
             )
-            response.raise_for_status()
-            data = response.json()
 
             if not data.get("projects") or len(data["projects"]) == 0:
                 logger.warning(
@@ -189,35 +278,41 @@ class JiraMetadataDetector:
             "Iniciando detección de campos obligatorios para tipo: %s", story_type
         )
 
-        # Primero intentar encontrar el ID real del tipo de issue usando la misma lógica
+        # Reutilizar los campos si preload_createmeta ya cargó este tipo
+        preloaded = self._createmeta_cache.get(
+            _cache_key({"issuetypeNames": story_type, "expand": _FIELDS_EXPAND})
+        )
+
+        # Si no, encontrar el ID real del tipo de issue usando la misma lógica
         # que validate_issue_type para manejar alias como Story/Historia
-        issue_type_id = self._find_issue_type_id(story_type)
-        if not issue_type_id:
-            logger.warning(
-                "No se encontró el tipo de issue '%s' en el proyecto %s",
+        issue_type_id = None
+        if preloaded is None:
+            issue_type_id = self._find_issue_type_id(story_type)
+            if not issue_type_id:
+                logger.warning(
+                    "No se encontró el tipo de issue '%s' en el proyecto %s",
+                    story_type,
+                    self.project_key,
+                )
+                return {}
+
+            logger.debug(
+                "ID del tipo de issue encontrado: %s para tipo '%s'",
+                issue_type_id,
                 story_type,
-                self.project_key,
             )
-            return {}
-
-        logger.debug(
-            "ID del tipo de issue encontrado: %s para tipo '%s'",
-            issue_type_id,
-            story_type,
-        )
 
         try:
-            url = f"{self.base_url}/rest/api/3/issue/createmeta"
-            params = {
-                "projectKeys": self.project_key,
-                "issuetypeIds": issue_type_id,  # Usar ID en lugar de nombre
-                "expand": "projects.issuetypes.fields",
-            }
-            logger.debug("Consultando API: %s con params: %s", url, params)
-
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            if preloaded is not None:
+                data = preloaded
+            else:
+                logger.debug(
+                    "Consultando createmeta para issuetypeIds=%s", issue_type_id
+                )
+                # Usar ID en lugar de nombre
+                data = self._fetch_createmeta(
+                    issuetypeIds=issue_type_id, expand=_FIELDS_EXPAND
+                )
             logger.debug(
                 "Respuesta API recibida: %d proyectos encontrados",
                 len(data.get("projects", [])),
@@ -247,93 +342,144 @@ class JiraMetadataDetector:
                 issuetype.get("id", "N/A"),
             )
 
-            fields = issuetype.get("fields", {})
-            logger.debug(
-                "Analizando %d campos disponibles para %s", len(fields), story_type
+            return self._collect_required_fields(
+                issuetype.get("fields", {}), story_type
             )
 
-            required_fields = {}
+        except Exception as e:
+            logger.error(
+                "Error detectando campos obligatorios para historias %s: %s",
+                story_type,
+                str(e),
+            )
+            logger.debug("Excepción completa:", exc_info=True)
+            return {}
 
-            for field_id, field_info in fields.items():
-                field_name = field_info.get("name", field_id)
-                is_required = field_info.get("required", False)
-                logger.debug(
-                    "Campo %s (%s): obligatorio=%s", field_name, field_id, is_required
-                )
+    def preload_createmeta(self, issue_types: List[str]) -> None:
+        """Precarga en una sola consulta los campos de varios tipos de issue.
 
-                # Solo campos obligatorios, excluyendo los básicos que ya manejamos
-                if is_required:
-                    field_name_lower = field_name.lower()
+        Solo llena el cache de createmeta: las llamadas posteriores a
+        detect_story_required_fields, detect_feature_required_fields o
+        detect_acceptance_criteria_fields con esos tipos no consultan Jira y
+        aplican sus propias reglas sobre los campos.
 
-                    # Excluir campos básicos que ya se manejan
-                    if field_name_lower in [
-                        "summary",
-                        "description",
-                        "project",
-                        "issuetype",
-                    ]:
-                        logger.debug("Excluyendo campo básico: %s", field_name)
-                        continue
+        Args:
+            issue_types: Nombres de los tipos de issue (ej: Story, Feature)
+        """
+        try:
+            data = self._fetch_createmeta(
+                issuetypeNames=",".join(issue_types), expand=_FIELDS_EXPAND
+            )
+        except Exception as e:
+            logger.error(
+                "Error precargando createmeta para %s: %s", issue_types, str(e)
+            )
+            return
 
-                    # Obtener valor por defecto si existe
-                    schema = field_info.get("schema", {})
-                    allowed_values = field_info.get("allowedValues")
-                    schema_type = schema.get("type", "string")
+        if not data.get("projects"):
+            logger.warning(
+                "No se encontraron proyectos en createmeta para %s", issue_types
+            )
+            return
+
+        project = data["projects"][0]
+        for issuetype in project.get("issuetypes", []):
+            # Respuesta equivalente a la consulta individual de este tipo
+            single_type_data = {"projects": [{**project, "issuetypes": [issuetype]}]}
+            name = issuetype.get("name", "")
+            self._createmeta_cache[
+                _cache_key({"issuetypeNames": name, "expand": _FIELDS_EXPAND})
+            ] = single_type_data
+            type_id = issuetype.get("id")
+            if type_id:
+                self._createmeta_cache[
+                    _cache_key({"issuetypeIds": type_id, "expand": _FIELDS_EXPAND})
+                ] = single_type_data
+
+    def _collect_required_fields(
+        self, fields: Dict[str, Any], issue_type: str
+    ) -> Dict[str, Any]:
+        """Obtiene los campos obligatorios con su valor por defecto.
 
-                    logger.debug(
-                        "Procesando campo obligatorio %s: schema_type=%s, allowed_values=%s",
-                        field_name,
-                        schema_type,
-                        len(allowed_values) if allowed_values else 0,
-                    )
+        Args:
+            fields: Campos de createmeta para el tipo de issue
+            issue_type: Nombre del tipo de issue (para logging)
 
-                    if allowed_values and len(allowed_values) > 0:
-                        # Campo con valores predefinidos - usar el primero como default
-                        default_value = allowed_values[0]
-                        logger.debug(
-                            "Campo %s tiene %d valores permitidos, usando: %s",
-                            field_name,
-                            len(allowed_values),
-                            default_value,
-                        )
+        Returns:
+            Dict con campos obligatorios requeridos
+        """
+        logger.debug(
+            "Analizando %d campos disponibles para %s", len(fields), issue_type
+        )
 
-                        if "id" in default_value:
-                            required_fields[field_id] = {"id": default_value["id"]}
-                        elif "value" in default_value:
-                            required_fields[field_id] = {
-                                "value": default_value["value"]
-                            }
-                        else:
-                            required_fields[field_id] = default_value
-                    else:
-                        # Campo de texto libre - depende del schema type
-                        logger.debug(
-                            "Campo %s es de texto libre, tipo: %s",
-                            field_name,
-                            schema_type,
-                        )
-                        if schema_type == "string":
-                            required_fields[field_id] = "default_value"
-                        elif schema_type == "number":
-                            required_fields[field_id] = 0
-                        else:
-                            required_fields[field_id] = "default_value"
+        required_fields = {}
 
+        for field_id, field_info in fields.items():
+            field_name = field_info.get("name", field_id)
+            is_required = field_info.get("required", False)
             logger.debug(
-                "Detección completada para %s: %d campos obligatorios encontrados",
-                story_type,
-                len(required_fields),
+                "Campo %s (%s): obligatorio=%s", field_name, field_id, is_required
             )
-            return required_fields
 
-        except Exception as e:
-            logger.error(
-                "Error detectando campos obligatorios para historias %s: %s",
-                story_type,
-                str(e),
-            )
-            logger.debug("Excepción completa:", exc_info=True)
-            return {}
+            # Solo campos obligatorios, excluyendo los básicos que ya manejamos
+            if is_required:
+                field_name_lower = field_name.lower()
+
+                # Excluir campos básicos que ya se manejan
+                if field_name_lower in [
+                    "summary",
+                    "description",
+                    "project",
+                    "issuetype",
+                ]:
+                    logger.debug("Excluyendo campo básico: %s", field_name)
+                    continue
+
+                # Obtener valor por defecto si existe
+                schema = field_info.get("schema", {})
+                allowed_values = field_info.get("allowedValues")
+                schema_type = schema.get("type", "string")
+
+                logger.debug(
+                    "Procesando campo obligatorio %s: schema_type=%s, allowed_values=%s",
+                    field_name,
+                    schema_type,
+                    len(allowed_values) if allowed_values else 0,
+                )
+
+                if allowed_values and len(allowed_values) > 0:
+                    # Campo con valores predefinidos - usar el primero como default
+                    default_value = allowed_values[0]
+                    logger.debug(
+                        "Campo %s tiene %d valores permitidos, usando: %s",
+                        field_name,
+                        len(allowed_values),
+                        default_value,
+                    )
+
+                    if "id" in default_value:
+                        required_fields[field_id] = {"id": default_value["id"]}
+                    elif "value" in default_value:
+                        required_fields[field_id] = {"value": default_value["value"]}
+                    else:
+                        required_fields[field_id] = default_value
+                else:
+                    # Campo de texto libre - depende del schema type
+                    logger.debug(
+                        "Campo %s es de texto libre, tipo: %s",
+                        field_name,
+                        schema_type,
+                    )
+                    required_fields[field_id] = _SCHEMA_TYPE_DEFAULTS.get(
+                        schema_type, _DEFAULT_FIELD_VALUE
+                    )
+
+        logger.debug(
+            "Detección completada para %s: %d campos obligatorios encontrados",
+            issue_type,
+            len(required_fields),
+        )
+        return required_fields
 
     def _find_issue_type_id(self, issue_type_name: str) -> Optional[str]:
         """Encuentra el ID de un tipo de issue por nombre, manejando alias.
@@ -349,43 +495,36 @@ class JiraMetadataDetector:
         """
         logger.debug("Buscando ID para tipo de issue: %s", issue_type_name)
         try:
-            url = f"{self.base_url}/rest/api/3/issue/createmeta"
-            params = {"projectKeys": self.project_key, "expand": "projects.issuetypes"}
-            logger.debug("Consultando todos los tipos disponibles: %s", url)
-
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            logger.debug("Consultando todos los tipos disponibles")
+            data = self._fetch_createmeta()
 
             if not data.get("projects") or len(data["projects"]) == 0:
                 logger.debug("No se encontraron proyectos")
                 return None
 
-            project = data["projects"][0]
-            all_issuetypes = project.get("issuetypes", [])
-            logger.debug(
-                "Proyecto encontrado con %d tipos de issue", len(all_issuetypes)
-            )
+            all_issuetypes = data["projects"][0].get("issuetypes", [])
+
+            # Índice nombre (insensible a mayúsculas) -> id, construido una sola vez
+            if self._issue_type_index is None:
+                logger.debug(
+                    "Proyecto encontrado con %d tipos de issue", len(all_issuetypes)
+                )
+                index: Dict[str, str] = {}
+                for issuetype in all_issuetypes:
+                    index.setdefault(
+                        issuetype.get("name", "").lower(), issuetype.get("id", "")
+                    )
+                self._issue_type_index = index
 
-            # Buscar el tipo de issue por nombre (insensible a mayúsculas)
             issue_type_lower = issue_type_name.lower()
-            for issuetype in all_issuetypes:
-                available_name = issuetype.get("name", "")
-                issue_type_id = issuetype.get("id", "")
+            if issue_type_lower in self._issue_type_index:
+                issue_type_id = self._issue_type_index[issue_type_lower]
                 logger.debug(
-                    "Comparando '%s' con '%s' (id: %s)",
+                    "Tipo de issue encontrado: %s -> id: %s",
                     issue_type_name,
-                    available_name,
                     issue_type_id,
                 )
-
-                if available_name.lower() == issue_type_lower:
-                    logger.debug(
-                        "Tipo de issue encontrado: %s -> id: %s",
-                        available_name,
-                        issue_type_id,
-                    )
-                    return issue_type_id
+                return issue_type_id
 
             # Si no se encuentra, mostrar tipos disponibles no-subtarea
             available_names = [
@@ -413,6 +552,10 @@ class JiraMetadataDetector:
             Dict con sugerencias para default_issue_type, subtask_issue_type, feature_issue_type
         """
         issue_types = self.get_available_issue_types()
+        standard_types = issue_types["standard"]
+        subtask_types = issue_types["subtasks"]
+        standard_names = set(standard_types)
+        subtask_names = set(subtask_types)
 
         suggestions = {
             "default_issue_type": "Story",
@@ -421,38 +564,35 @@ class JiraMetadataDetector:
         }
 
         # Buscar Story o equivalente
-        story_candidates = ["Story", "Historia", "Historia de Usuario", "User Story"]
-        for candidate in story_candidates:
-            if candidate in issue_types["standard"]:
+        for candidate in _STORY_TYPE_CANDIDATES:
+            if candidate in standard_names:
                 suggestions["default_issue_type"] = candidate
                 break
         else:
             # Si no encuentra, usar el primer tipo estándar disponible
-            if issue_types["standard"]:
-                suggestions["default_issue_type"] = issue_types["standard"][0]
+            if standard_types:
+                suggestions["default_issue_type"] = standard_types[0]
 
         # Buscar subtarea
-        subtask_candidates = ["Subtarea", "Sub-task", "Subtask", "Sub-tarea"]
-        for candidate in subtask_candidates:
-            if candidate in issue_types["subtasks"]:
+        for candidate in _SUBTASK_TYPE_CANDIDATES:
+            if candidate in subtask_names:
                 suggestions["subtask_issue_type"] = candidate
                 break
         else:
             # Usar el primer tipo de subtarea disponible
-            if issue_types["subtasks"]:
-                suggestions["subtask_issue_type"] = issue_types["subtasks"][0]
+            if subtask_types:
+                suggestions["subtask_issue_type"] = subtask_types[0]
 
         # Buscar Feature o Epic
-        feature_candidates = ["Feature", "Epic", "Funcionalidad", "Épica"]
-        for candidate in feature_candidates:
-            if candidate in issue_types["standard"]:
+        for candidate in _FEATURE_TYPE_CANDIDATES:
+            if candidate in standard_names:
                 suggestions["feature_issue_type"] = candidate
                 break
         else:
             # Si no encuentra, buscar algo que suene a contenedor
-            for issue_type in issue_types["standard"]:
-                container_words = ["parent", "container", "theme", "initiative"]
-                if any(word in issue_type.lower() for word in container_words):
+            normalized_types = [(name, name.lower()) for name in standard_types]
+            for issue_type, issue_type_lower in normalized_types:
+                if any(word in issue_type_lower for word in _CONTAINER_TYPE_WORDS):
                     suggestions["feature_issue_type"] = issue_type
                     break
             else:
@@ -464,16 +604,9 @@ class JiraMetadataDetector:
     def _get_fields_for_issue_type(self, issue_type: str) -> Optional[Dict[str, Any]]:
         """Obtiene campos disponibles para un tipo de issue específico."""
         try:
-            response = self.session.get(
-                f"{self.base_url}/rest/api/3/issue/createmeta",
-                params={
-                    "projectKeys": self.project_key,
-                    "issuetypeNames": issue_type,
-                    "expand": "projects.issuetypes.fields",
-                },
+            data = self._fetch_createmeta(
+                issuetypeNames=issue_type, expand=_FIELDS_EXPAND
             )
-            response.raise_for_status()
-            data = response.json()
 
             if (
                 data.get("projects")
@@ -494,42 +627,20 @@ class JiraMetadataDetector:
         """Filtra campos que podrían ser para criterios de aceptación."""
         candidates = []
 
-        # Palabras clave que indican criterios de aceptación
-        criteria_keywords = [
-            "criteria",
-            "criterio",
-            "criterios",
-            "acceptance",
-            "aceptacion",
-            "aceptación",
-            "condition",
-            "condicion",
-            "condición",
-            "requirement",
-            "requisito",
-            "test",
-        ]
-
         for field_id, field_info in fields.items():
             # Solo campos personalizados (customfield_*)
-            if not field_id.startswith("customfield_"):
+            if not field_id.startswith(_CUSTOM_FIELD_PREFIX):
                 continue
 
-            field_name = field_info.get("name", "").lower()
-            field_type = field_info.get("schema", {}).get("type", "")
-
             # Filtrar por tipo de campo (text, rich text)
-            valid_types = [
-                "string",
-                "any",
-                "doc",
-                "textarea",
-            ]  # Tipos que pueden contener texto
-            if field_type not in valid_types:
+            field_type = field_info.get("schema", {}).get("type", "")
+            if field_type not in _VALID_CRITERIA_TYPES:
                 continue
 
+            field_name = field_info.get("name", "").lower()
+
             # Buscar palabras clave en el nombre
-            if any(keyword in field_name for keyword in criteria_keywords):
+            if _CRITERIA_KEYWORDS_PATTERN.search(field_name):
                 candidates.append(
                     {
                         "id": field_id,
@@ -541,14 +652,11 @@ class JiraMetadataDetector:
         # Ordenar por relevancia (criterios específicos primero)
         def relevance_score(field):
             name = field["name"].lower()
-            score = 0
-            if "acceptance" in name or "aceptacion" in name or "aceptación" in name:
-                score += 10
-            if "criteria" in name or "criterio" in name:
-                score += 8
-            if "condition" in name or "condicion" in name or "condición" in name:
-                score += 5
-            return score
-
-        candidates.sort(key=relevance_score, reverse=True)
-        return candidates[:5]  # Máximo 5 candidatos
+            return sum(
+                score
+                for pattern, score in _CRITERIA_RELEVANCE_SCORES
+                if pattern.search(name)
+            )
+
+        # Máximo 5 candidatos; nlargest conserva el orden original ante empates
+        return heapq.nlargest(5, candidates, key=relevance_score)
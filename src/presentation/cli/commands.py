@@ -128,6 +128,13 @@ def _detect_jira_configuration(env_values):
             f"✓ Tipos de issue detectados: {type_suggestions['default_issue_type']}, {type_suggestions['subtask_issue_type']}, {type_suggestions['feature_issue_type']}"
         )
 
+        # Precargar en una sola consulta los campos de los tipos que se analizarán
+        planned_types = {
+            type_suggestions["default_issue_type"],
+            type_suggestions["feature_issue_type"],
+        }
+        detector.preload_createmeta(sorted(planned_types))
+
         # Detectar campos de criterios de aceptación
         criteria_fields = detector.detect_acceptance_criteria_fields()
         selected_criteria_field = None
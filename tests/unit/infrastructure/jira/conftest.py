@@ -0,0 +1,29 @@
+"""Shared fixtures for Jira infrastructure tests."""
+import pytest
+import requests
+from unittest.mock import Mock
+
+
+@pytest.fixture
+def mock_session_response():
+    """Fresh session/response pair with session.get returning the response."""
+    session = Mock(spec=requests.Session)
+    response = Mock()
+    response.raise_for_status.return_value = None
+    session.get.return_value = response
+    return session, response
+
+
+@pytest.fixture
+def make_session(mock_session_response):
+    """Factory that wires the session/response pair with a json() payload or error."""
+    session, response = mock_session_response
+
+    def _make(json_payload=None, json_side_effect=None):
+        if json_side_effect is not None:
+            response.json.side_effect = json_side_effect
+        else:
+            response.json.return_value = json_payload
+        return session, response
+
+    return _make
@@ -1,19 +1,176 @@
 """Tests para el detector de metadatos de Jira."""
 import pytest
 import json
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock
 import requests
 
+from src.infrastructure.jira import metadata_detector
 from src.infrastructure.jira.metadata_detector import JiraMetadataDetector
 
 
+EMPTY_PROJECTS_PAYLOAD = {"projects": []}
+
+ISSUE_TYPES_PAYLOAD = {
+    "projects": [{
+        "issuetypes": [
+            {"name": "Story", "subtask": False},
+            {"name": "Feature", "subtask": False},
+            {"name": "Subtarea", "subtask": True},
+            {"name": "Sub-task", "subtask": True}
+        ]
+    }]
+}
+
+CRITERIA_FIELDS_PAYLOAD = {
+    "projects": [{
+        "issuetypes": [{
+            "fields": {
+                "customfield_10001": {
+                    "name": "Acceptance Criteria",
+                    "schema": {"type": "string"}
+                },
+                "customfield_10002": {
+                    "name": "Criterios de Aceptación",
+                    "schema": {"type": "doc"}
+                },
+                "customfield_10003": {
+                    "name": "Regular Field",
+                    "schema": {"type": "string"}
+                },
+                "summary": {
+                    "name": "Summary",
+                    "schema": {"type": "string"}
+                }
+            }
+        }]
+    }]
+}
+
+FEATURE_FIELDS_PAYLOAD = {
+    "projects": [{
+        "issuetypes": [{
+            "fields": {
+                "project": {"required": True, "name": "Project"},
+                "summary": {"required": True, "name": "Summary"},
+                "issuetype": {"required": True, "name": "Issue Type"},
+                "description": {"required": True, "name": "Description"},
+                "customfield_11493": {
+                    "required": True,
+                    "name": "Backlog",
+                    "allowedValues": [
+                        {"id": "54672", "value": "Product Backlog"}
+                    ]
+                },
+                "customfield_10004": {
+                    "name": "Epic Name",
+                    "required": False
+                },
+                "customfield_10005": {
+                    "required": True,
+                    "name": "Priority Field",
+                    "allowedValues": [
+                        {"value": "High"},
+                        {"value": "Medium"}
+                    ]
+                }
+            }
+        }]
+    }]
+}
+
+FEATURE_FIELDS_NO_EPIC_PAYLOAD = {
+    "projects": [{
+        "issuetypes": [{
+            "fields": {
+                "customfield_11493": {
+                    "required": True,
+                    "name": "Backlog",
+                    "allowedValues": [{"id": "54672", "value": "Product Backlog"}]
+                }
+            }
+        }]
+    }]
+}
+
+STORY_TYPE_PAYLOAD = {
+    "projects": [{
+        "issuetypes": [{"id": "10", "name": "Story"}]
+    }]
+}
+
+STORY_FIELDS_PAYLOAD = {
+    "projects": [{
+        "name": "Test Project",
+        "id": "12345",
+        "issuetypes": [{
+            "name": "Story",
+            "id": "10",
+            "fields": {
+                # Basic fields (should be excluded)
+                "summary": {"name": "Summary", "required": True},
+                "description": {"name": "Description", "required": True},
+
+                # Required custom field with allowed values (ID)
+                "customfield_10001": {
+                    "name": "Priority Level",
+                    "required": True,
+                    "allowedValues": [{"id": "1", "value": "High"}]
+                },
+
+                # Required custom field with allowed values (value)
+                "customfield_10002": {
+                    "name": "Component",
+                    "required": True,
+                    "allowedValues": [{"value": "Backend"}]
+                },
+
+                # Required string field without allowed values
+                "customfield_10003": {
+                    "name": "Text Field",
+                    "required": True,
+                    "schema": {"type": "string"}
+                },
+
+                # Required number field
+                "customfield_10004": {
+                    "name": "Story Points",
+                    "required": True,
+                    "schema": {"type": "number"}
+                },
+
+                # Non-required field (should be excluded)
+                "customfield_10005": {
+                    "name": "Optional Field",
+                    "required": False
+                }
+            }
+        }]
+    }]
+}
+
+
+def _build_response(payload):
+    """Respuesta mock con el payload disponible vía json() y como bytes."""
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    return response
+
+
 @pytest.fixture
 def mock_session():
     """Sesión mock para pruebas."""
-    session = Mock(spec=requests.Session)
+    session = Mock()
     return session
 
 
+@pytest.fixture
+def make_response():
+    """Fábrica de respuestas mock a partir de un payload JSON."""
+    return _build_response
+
+
 @pytest.fixture
 def detector(mock_session):
     """Instancia del detector para pruebas."""
@@ -23,22 +180,10 @@ def detector(mock_session):
 class TestJiraMetadataDetector:
     """Tests para JiraMetadataDetector."""
 
-    def test_get_available_issue_types_success(self, detector, mock_session):
+    def test_get_available_issue_types_success(self, detector, mock_session, make_response):
         """Test obtención exitosa de tipos de issue."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [
-                    {"name": "Story", "subtask": False},
-                    {"name": "Feature", "subtask": False},
-                    {"name": "Subtarea", "subtask": True},
-                    {"name": "Sub-task", "subtask": True}
-                ]
-            }]
-        }
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = make_response(ISSUE_TYPES_PAYLOAD)
 
         # Act
         result = detector.get_available_issue_types()
@@ -48,13 +193,25 @@ class TestJiraMetadataDetector:
         assert result["subtasks"] == ["Subtarea", "Sub-task"]
         assert result["all"] == ["Story", "Feature", "Subtarea", "Sub-task"]
 
-    def test_get_available_issue_types_no_projects(self, detector, mock_session):
+    def test_get_available_issue_types_cached_second_call(self, detector, mock_session, make_response):
+        """Test que la segunda llamada reutiliza los tipos ya categorizados."""
+        mock_session.get.return_value = make_response(ISSUE_TYPES_PAYLOAD)
+
+        first = detector.get_available_issue_types()
+        first["standard"].append("Modified")
+        second = detector.get_available_issue_types()
+
+        assert second == {
+            "standard": ["Story", "Feature"],
+            "subtasks": ["Subtarea", "Sub-task"],
+            "all": ["Story", "Feature", "Subtarea", "Sub-task"],
+        }
+        assert mock_session.get.call_count == 1
+
+    def test_get_available_issue_types_no_projects(self, detector, mock_session, make_response):
         """Test cuando no hay proyectos en la respuesta."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {"projects": []}
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = make_response(EMPTY_PROJECTS_PAYLOAD)
 
         # Act
         result = detector.get_available_issue_types()
@@ -73,36 +230,13 @@ class TestJiraMetadataDetector:
         # Assert
         assert result == {"standard": [], "subtasks": [], "all": []}
 
-    def test_detect_acceptance_criteria_fields_success(self, detector, mock_session):
+    def test_detect_acceptance_criteria_fields_success(self, detector, mock_session, make_response):
         """Test detección exitosa de campos de criterios."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{
-                    "fields": {
-                        "customfield_10001": {
-                            "name": "Acceptance Criteria",
-                            "schema": {"type": "string"}
-                        },
-                        "customfield_10002": {
-                            "name": "Criterios de Aceptación",
-                            "schema": {"type": "doc"}
-                        },
-                        "customfield_10003": {
-                            "name": "Regular Field",
-                            "schema": {"type": "string"}
-                        },
-                        "summary": {
-                            "name": "Summary",
-                            "schema": {"type": "string"}
-                        }
-                    }
-                }]
-            }]
-        }
-        mock_session.get.return_value = mock_response
+        mock_session.get.side_effect = [
+            make_response(ISSUE_TYPES_PAYLOAD),
+            make_response(CRITERIA_FIELDS_PAYLOAD),
+        ]
 
         # Act
         result = detector.detect_acceptance_criteria_fields()
@@ -115,43 +249,79 @@ class TestJiraMetadataDetector:
         assert result[1]["id"] == "customfield_10002"  # "criterios" tiene menor score
         assert result[1]["name"] == "Criterios de Aceptación"
 
-    def test_detect_feature_required_fields_success(self, detector, mock_session):
-        """Test detección de campos obligatorios para Features."""
+    def test_detect_acceptance_criteria_fields_priority_order(self, detector, mock_session, make_response):
+        """Test que solo se consultan los tipos existentes, en orden de prioridad."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{
-                    "fields": {
-                        "project": {"required": True, "name": "Project"},
-                        "summary": {"required": True, "name": "Summary"},
-                        "issuetype": {"required": True, "name": "Issue Type"},
-                        "description": {"required": True, "name": "Description"},
-                        "customfield_11493": {
-                            "required": True,
-                            "name": "Backlog",
-                            "allowedValues": [
-                                {"id": "54672", "value": "Product Backlog"}
-                            ]
-                        },
-                        "customfield_10004": {
-                            "name": "Epic Name",
-                            "required": False
-                        },
-                        "customfield_10005": {
-                            "required": True,
-                            "name": "Priority Field",
-                            "allowedValues": [
-                                {"value": "High"},
-                                {"value": "Medium"}
-                            ]
-                        }
-                    }
-                }]
-            }]
+        issue_types_payload = {"projects": [{"issuetypes": [
+            {"name": "Bug", "subtask": False},
+            {"name": "User Story", "subtask": False},
+            {"name": "Historia", "subtask": False},
+        ]}]}
+        fields_by_type = {
+            "Historia": {
+                "customfield_20001": {
+                    "name": "Criterios Historia", "schema": {"type": "string"}
+                }
+            },
+            "User Story": {
+                "customfield_20002": {
+                    "name": "Acceptance Criteria", "schema": {"type": "string"}
+                }
+            },
         }
-        mock_session.get.return_value = mock_response
+
+        def get_by_type(url, params):
+            if "issuetypeNames" not in params:
+                return make_response(issue_types_payload)
+            fields = fields_by_type[params["issuetypeNames"]]
+            return make_response({"projects": [{"issuetypes": [{"fields": fields}]}]})
+
+        mock_session.get.side_effect = get_by_type
+
+        # Act
+        result = detector.detect_acceptance_criteria_fields()
+
+        # Assert
+        assert [field["id"] for field in result] == ["customfield_20001"]
+        requested_types = [
+            call.kwargs["params"].get("issuetypeNames")
+            for call in mock_session.get.call_args_list
+        ]
+        assert requested_types == [None, "Historia"]
+
+    def test_detect_acceptance_criteria_fields_without_issue_types(self, detector, mock_session, make_response):
+        """Test que sin listado de tipos se prueban todos los candidatos en orden."""
+        # Arrange
+        fields_payload = {"projects": [{"issuetypes": [{"fields": {
+            "customfield_20002": {
+                "name": "Acceptance Criteria", "schema": {"type": "string"}
+            }
+        }}]}]}
+
+        def get_by_type(url, params):
+            if params.get("issuetypeNames") == "User Story":
+                return make_response(fields_payload)
+            return make_response(EMPTY_PROJECTS_PAYLOAD)
+
+        mock_session.get.side_effect = get_by_type
+
+        # Act
+        result = detector.detect_acceptance_criteria_fields()
+
+        # Assert
+        assert [field["id"] for field in result] == ["customfield_20002"]
+        requested_types = [
+            call.kwargs["params"].get("issuetypeNames")
+            for call in mock_session.get.call_args_list
+        ]
+        assert requested_types == [
+            None, "Story", "Historia", "Historia de Usuario", "User Story"
+        ]
+
+    def test_detect_feature_required_fields_success(self, detector, mock_session, make_response):
+        """Test detección de campos obligatorios para Features."""
+        # Arrange
+        mock_session.get.return_value = make_response(FEATURE_FIELDS_PAYLOAD)
 
         # Act
         required_fields, epic_name_field = detector.detect_feature_required_fields("Feature")
@@ -162,25 +332,10 @@ class TestJiraMetadataDetector:
         assert required_fields["customfield_11493"] == {"id": "54672"}
         assert required_fields["customfield_10005"] == {"value": "High"}
 
-    def test_detect_feature_required_fields_no_epic_field(self, detector, mock_session):
+    def test_detect_feature_required_fields_no_epic_field(self, detector, mock_session, make_response):
         """Test cuando no hay campo Epic Name."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{
-                    "fields": {
-                        "customfield_11493": {
-                            "required": True,
-                            "name": "Backlog",
-                            "allowedValues": [{"id": "54672", "value": "Product Backlog"}]
-                        }
-                    }
-                }]
-            }]
-        }
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = make_response(FEATURE_FIELDS_NO_EPIC_PAYLOAD)
 
         # Act
         required_fields, epic_name_field = detector.detect_feature_required_fields("Feature")
@@ -241,6 +396,98 @@ class TestJiraMetadataDetector:
         # La lógica busca "parent" en el nombre, encuentra "Custom Parent"
         assert result["feature_issue_type"] == "Custom Parent"
 
+    def test_createmeta_cached_across_calls(self, detector, mock_session, make_response):
+        """Test que createmeta se consulta una sola vez para los mismos parámetros."""
+        # Arrange
+        mock_session.get.return_value = make_response({
+            "projects": [{
+                "issuetypes": [{
+                    "fields": {
+                        "customfield_11493": {
+                            "required": True,
+                            "name": "Backlog",
+                            "allowedValues": [{"id": "54672"}]
+                        }
+                    }
+                }]
+            }]
+        })
+
+        # Act
+        first = detector.detect_feature_required_fields("Feature")
+        second = detector.detect_feature_required_fields("Feature")
+        fields = detector._get_fields_for_issue_type("Feature")
+
+        # Assert
+        assert first == second
+        assert "customfield_11493" in fields
+        assert mock_session.get.call_count == 1
+
+    def test_createmeta_errors_are_not_cached(self, detector, mock_session, make_response):
+        """Test que una respuesta con error no queda cacheada."""
+        # Arrange
+        mock_response = make_response({
+            "projects": [{"issuetypes": [{"name": "Story", "subtask": False}]}]
+        })
+        mock_session.get.side_effect = [
+            requests.RequestException("Connection error"),
+            mock_response,
+        ]
+
+        # Act
+        failed = detector.get_available_issue_types()
+        recovered = detector.get_available_issue_types()
+
+        # Assert
+        assert failed["all"] == []
+        assert recovered["all"] == ["Story"]
+        assert mock_session.get.call_count == 2
+
+    def test_issue_types_lookup_does_not_expand_fields(self, detector, mock_session, make_response):
+        """Test que la consulta de tipos no solicita el esquema de campos."""
+        # Arrange
+        mock_session.get.return_value = make_response({
+            "projects": [{"issuetypes": [{"id": "1", "name": "Story"}]}]
+        })
+
+        # Act
+        detector.get_available_issue_types()
+
+        # Assert
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params == {"projectKeys": "TEST"}
+        assert "expand" not in params
+
+    def test_fields_lookup_expands_only_requested_type(self, detector, mock_session, make_response):
+        """Test que la consulta de campos se limita al tipo pedido."""
+        # Arrange
+        mock_session.get.return_value = make_response(EMPTY_PROJECTS_PAYLOAD)
+
+        # Act
+        detector._get_fields_for_issue_type("Story")
+
+        # Assert
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params["expand"] == "projects.issuetypes.fields"
+        assert params["issuetypeNames"] == "Story"
+
+    def test_createmeta_parsed_with_orjson(self, detector, mock_session, monkeypatch, make_response):
+        """Test que createmeta se decodifica con orjson desde los bytes crudos."""
+        # Arrange
+        payload = {"projects": [{"issuetypes": [{"name": "Story", "subtask": False}]}]}
+        mock_response = make_response(payload)
+        mock_session.get.return_value = mock_response
+        loads = Mock(side_effect=metadata_detector.orjson.loads)
+        monkeypatch.setattr(metadata_detector.orjson, "loads", loads)
+
+        # Act
+        result = detector.get_available_issue_types()
+
+        # Assert
+        assert result["all"] == ["Story"]
+        loads.assert_called_once_with(mock_response.content)
+        mock_response.json.assert_not_called()
+
     def test_filter_criteria_fields_with_various_names(self, detector):
         """Test filtrado de campos con varios nombres."""
         # Arrange
@@ -300,29 +547,23 @@ class TestJiraMetadataDetector:
         # Assert
         assert len(result) == 0
 
-    def test_get_fields_for_issue_type_success(self, detector, mock_session):
-        """Test obtención exitosa de campos para tipo de issue."""
-        # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{
-                    "fields": {
-                        "customfield_10001": {"name": "Test Field"}
-                    }
-                }]
-            }]
-        }
-        mock_session.get.return_value = mock_response
+    @pytest.mark.parametrize("payload,expected", [
+        (
+            {"projects": [{"issuetypes": [{
+                "fields": {"customfield_10001": {"name": "Test Field"}}
+            }]}]},
+            {"customfield_10001": {"name": "Test Field"}},
+        ),
+        (EMPTY_PROJECTS_PAYLOAD, None),
+        ({"projects": [{"issuetypes": []}]}, None),
+    ], ids=["success", "no_projects", "no_issuetypes"])
+    def test_get_fields_for_issue_type(self, detector, mock_session, make_response, payload, expected):
+        """Test obtención de campos para tipo de issue según la respuesta."""
+        mock_session.get.return_value = make_response(payload)
 
-        # Act
         result = detector._get_fields_for_issue_type("Story")
 
-        # Assert
-        assert result is not None
-        assert "customfield_10001" in result
-        assert result["customfield_10001"]["name"] == "Test Field"
+        assert result == expected
 
     def test_get_fields_for_issue_type_error(self, detector, mock_session):
         """Test manejo de errores al obtener campos."""
@@ -335,28 +576,6 @@ class TestJiraMetadataDetector:
         # Assert
         assert result is None
 
-    def test_get_fields_for_issue_type_no_projects(self, detector, mock_session):
-        """Test _get_fields_for_issue_type when no projects found."""
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {"projects": []}
-        mock_session.get.return_value = mock_response
-        
-        result = detector._get_fields_for_issue_type("Story")
-        assert result is None
-
-    def test_get_fields_for_issue_type_no_issuetypes(self, detector, mock_session):
-        """Test _get_fields_for_issue_type when no issuetypes found."""
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{"issuetypes": []}]
-        }
-        mock_session.get.return_value = mock_response
-        
-        result = detector._get_fields_for_issue_type("Story")
-        assert result is None
-
     def test_filter_criteria_fields_type_filtering(self, detector):
         """Test that _filter_criteria_fields correctly filters by field type."""
         fields = {
@@ -388,6 +607,26 @@ class TestJiraMetadataDetector:
         assert "Criteria Field" not in names  # Invalid type
         assert "Summary" not in names  # Not a custom field
 
+    def test_filter_criteria_fields_large_field_set(self, detector):
+        """Test filtrado de miles de campos conservando solo los relevantes."""
+        fields = {
+            f"customfield_{i}": {"name": f"Field {i}", "schema": {"type": "string"}}
+            for i in range(10_000)
+        }
+        fields["customfield_99998"] = {
+            "name": "Condiciones", "schema": {"type": "string"}
+        }
+        fields["customfield_99999"] = {
+            "name": "Criterios de Aceptación", "schema": {"type": "doc"}
+        }
+
+        result = detector._filter_criteria_fields(fields)
+
+        assert [field["id"] for field in result] == [
+            "customfield_99999",
+            "customfield_99998",
+        ]
+
 
 class TestMetadataDetectorMethods:
     """Tests for various metadata detector methods."""
@@ -444,82 +683,43 @@ class TestMetadataDetectorMethods:
 class TestFindIssueTypeId:
     """Tests para el método _find_issue_type_id."""""
 
-    def test_find_issue_type_id_exact_match(self, detector, mock_session):
-        """Test encontrar tipo de issue con nombre exacto."""
-        # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [
-                    {"id": "1", "name": "Story"},
-                    {"id": "2", "name": "Bug"}
-                ]
-            }]
-        }
-        mock_session.get.return_value = mock_response
-
-        # Act
-        result = detector._find_issue_type_id("Story")
-
-        # Assert
-        assert result == "1"
-
-    def test_find_issue_type_id_case_insensitive(self, detector, mock_session):
-        """Test encontrar tipo de issue insensible a mayúsculas."""
-        # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [
-                    {"id": "1", "name": "Historia"},
-                    {"id": "2", "name": "Bug"}
-                ]
-            }]
-        }
-        mock_session.get.return_value = mock_response
+    @pytest.mark.parametrize("issuetypes,query,expected", [
+        ([{"id": "1", "name": "Story"}, {"id": "2", "name": "Bug"}], "Story", "1"),
+        ([{"id": "1", "name": "Historia"}, {"id": "2", "name": "Bug"}], "historia", "1"),
+        ([{"id": "1", "name": "Bug"}, {"id": "2", "name": "Task"}], "Story", None),
+        (None, "Story", None),
+    ], ids=["exact_match", "case_insensitive", "not_found", "no_projects"])
+    def test_find_issue_type_id(self, detector, mock_session, make_response, issuetypes, query, expected):
+        """Test búsqueda del ID de tipo de issue por nombre."""
+        projects = [] if issuetypes is None else [{"issuetypes": issuetypes}]
+        mock_session.get.return_value = make_response({"projects": projects})
 
-        # Act - Buscar "story" debe encontrar "Historia"
-        result = detector._find_issue_type_id("historia")
+        result = detector._find_issue_type_id(query)
 
-        # Assert
-        assert result == "1"
+        assert result == expected
 
-    def test_find_issue_type_id_not_found(self, detector, mock_session):
-        """Test cuando no se encuentra el tipo de issue."""
+    def test_find_issue_type_id_multiple_lookups_single_fetch(self, detector, mock_session, make_response):
+        """Test que varias búsquedas reutilizan el índice de tipos."""
         # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
+        mock_session.get.return_value = make_response({
             "projects": [{
                 "issuetypes": [
-                    {"id": "1", "name": "Bug"},
-                    {"id": "2", "name": "Task"}
+                    {"id": "1", "name": "Story"},
+                    {"id": "2", "name": "Feature"},
+                    {"id": "3", "name": "Subtarea", "subtask": True}
                 ]
             }]
-        }
-        mock_session.get.return_value = mock_response
-
-        # Act
-        result = detector._find_issue_type_id("Story")
-
-        # Assert
-        assert result is None
-
-    def test_find_issue_type_id_no_projects(self, detector, mock_session):
-        """Test cuando no hay proyectos en la respuesta."""
-        # Arrange
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {"projects": []}
-        mock_session.get.return_value = mock_response
+        })
 
         # Act
-        result = detector._find_issue_type_id("Story")
+        results = [
+            detector._find_issue_type_id(name)
+            for name in ("Story", "feature", "SUBTAREA", "Epic")
+        ]
 
         # Assert
-        assert result is None
+        assert results == ["1", "2", "3", None]
+        assert mock_session.get.call_count == 1
 
     def test_find_issue_type_id_network_error(self, detector, mock_session):
         """Test manejo de errores de red."""
@@ -536,69 +736,13 @@ class TestFindIssueTypeId:
 class TestDetectStoryRequiredFields:
     """Tests para detect_story_required_fields."""
 
-    def test_detect_story_required_fields_success(self, detector, mock_session):
+    def test_detect_story_required_fields_success(self, detector, mock_session, make_response):
         """Test successful detection of required fields."""
         # Mock _find_issue_type_id to return an ID
-        find_id_response = Mock()
-        find_id_response.raise_for_status = Mock()
-        find_id_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{"id": "10", "name": "Story"}]
-            }]
-        }
+        find_id_response = make_response(STORY_TYPE_PAYLOAD)
         
         # Mock createmeta call response
-        createmeta_response = Mock()
-        createmeta_response.raise_for_status = Mock()
-        createmeta_response.json.return_value = {
-            "projects": [{
-                "name": "Test Project",
-                "id": "12345",
-                "issuetypes": [{
-                    "name": "Story",
-                    "id": "10",
-                    "fields": {
-                        # Basic fields (should be excluded)
-                        "summary": {"name": "Summary", "required": True},
-                        "description": {"name": "Description", "required": True},
-                        
-                        # Required custom field with allowed values (ID)
-                        "customfield_10001": {
-                            "name": "Priority Level",
-                            "required": True,
-                            "allowedValues": [{"id": "1", "value": "High"}]
-                        },
-                        
-                        # Required custom field with allowed values (value)
-                        "customfield_10002": {
-                            "name": "Component",
-                            "required": True,
-                            "allowedValues": [{"value": "Backend"}]
-                        },
-                        
-                        # Required string field without allowed values
-                        "customfield_10003": {
-                            "name": "Text Field",
-                            "required": True,
-                            "schema": {"type": "string"}
-                        },
-                        
-                        # Required number field
-                        "customfield_10004": {
-                            "name": "Story Points",
-                            "required": True,
-                            "schema": {"type": "number"}
-                        },
-                        
-                        # Non-required field (should be excluded)
-                        "customfield_10005": {
-                            "name": "Optional Field",
-                            "required": False
-                        }
-                    }
-                }]
-            }]
-        }
+        createmeta_response = make_response(STORY_FIELDS_PAYLOAD)
         
         # First call for _find_issue_type_id, second for createmeta
         mock_session.get.side_effect = [find_id_response, createmeta_response]
@@ -620,20 +764,94 @@ class TestDetectStoryRequiredFields:
         # Verify both API calls were made
         assert mock_session.get.call_count == 2
 
-    def test_detect_story_required_fields_type_not_found(self, detector, mock_session):
+        # Second detection is served from the createmeta cache
+        assert detector.detect_story_required_fields("Story") == result
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.parametrize("schema_type,expected", [
+        ("string", "default_value"),
+        ("number", 0),
+        ("date", "default_value"),
+        (None, "default_value"),
+    ])
+    def test_collect_required_fields_schema_defaults(self, detector, schema_type, expected):
+        """Test valor por defecto según el tipo de schema de campos libres."""
+        field = {"name": "Custom", "required": True}
+        if schema_type is not None:
+            field["schema"] = {"type": schema_type}
+
+        result = detector._collect_required_fields({"customfield_1": field}, "Story")
+
+        assert result == {"customfield_1": expected}
+
+    def test_preload_createmeta_single_request(self, detector, mock_session, make_response):
+        """Test que varios tipos se precargan con una sola consulta createmeta."""
+        # Arrange
+        mock_session.get.return_value = make_response({
+            "projects": [{
+                "id": "12345",
+                "issuetypes": [
+                    {
+                        "id": "10",
+                        "name": "Story",
+                        "fields": {
+                            "summary": {"name": "Summary", "required": True},
+                            "customfield_10004": {
+                                "name": "Story Points",
+                                "required": True,
+                                "schema": {"type": "number"}
+                            }
+                        }
+                    },
+                    {
+                        "id": "20",
+                        "name": "Feature",
+                        "fields": {
+                            "customfield_10010": {"name": "Epic Name", "required": False},
+                            "customfield_11493": {
+                                "name": "Backlog",
+                                "required": True,
+                                "allowedValues": [{"id": "54672"}]
+                            }
+                        }
+                    }
+                ]
+            }]
+        })
+
+        # Act
+        result = detector.preload_createmeta(["Story", "Feature"])
+        story_fields = detector.detect_story_required_fields("Story")
+        feature_fields, epic_name_field = detector.detect_feature_required_fields("Feature")
+
+        # Assert
+        assert result is None
+        assert story_fields == {"customfield_10004": 0}
+        assert feature_fields == {"customfield_11493": {"id": "54672"}}
+        assert epic_name_field == "customfield_10010"
+        assert mock_session.get.call_count == 1
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params["issuetypeNames"] == "Story,Feature"
+
+    def test_preload_createmeta_error(self, detector, mock_session):
+        """Test que un error en la precarga no deja respuestas cacheadas."""
+        mock_session.get.side_effect = requests.RequestException("Network error")
+
+        detector.preload_createmeta(["Story", "Feature"])
+
+        assert detector._createmeta_cache == {}
+
+    def test_detect_story_required_fields_type_not_found(self, detector, mock_session, make_response):
         """Test cuando el tipo no se encuentra."""
         # Arrange - Mock response without the Story type
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {
+        mock_session.get.return_value = make_response({
             "projects": [{
                 "issuetypes": [
                     {"id": "11", "name": "Bug"},
                     {"id": "12", "name": "Task"}
                 ]
             }]
-        }
-        mock_session.get.return_value = mock_response
+        })
 
         # Act
         result = detector.detect_story_required_fields("Story")
@@ -655,9 +873,17 @@ class TestDetectStoryRequiredFields:
 
     def test_detect_acceptance_criteria_fields_error(self, detector, mock_session):
         """Test error handling in acceptance criteria detection."""
-        with patch.object(detector, '_get_fields_for_issue_type', side_effect=Exception("API Error")):
-            result = detector.detect_acceptance_criteria_fields()
-            assert result == []
+        detector.get_available_issue_types = Mock(return_value={
+            "standard": ["Story"],
+            "subtasks": [],
+            "all": ["Story"]
+        })
+        detector._get_fields_for_issue_type = Mock(side_effect=Exception("API Error"))
+
+        result = detector.detect_acceptance_criteria_fields()
+
+        assert result == []
+        detector._get_fields_for_issue_type.assert_called_once_with("Story")
 
     def test_detect_acceptance_criteria_fields_fallback_to_standard_type(self, detector, mock_session):
         """Test fallback to first standard type when story types not found."""
@@ -675,12 +901,12 @@ class TestDetectStoryRequiredFields:
             }
         }
         
-        with patch.object(detector, '_get_fields_for_issue_type') as mock_get_fields:
-            # Return None for story types, then return fields for Task
-            mock_get_fields.side_effect = [None, None, None, None, task_fields]
-            
-            result = detector.detect_acceptance_criteria_fields()
-            
-            # Should have found criteria field from Task type
-            assert len(result) == 1
-            assert result[0]["name"] == "Acceptance Criteria"
\ No newline at end of file
+        detector._get_fields_for_issue_type = Mock(
+            side_effect=lambda issue_type: {"Task": task_fields}.get(issue_type)
+        )
+
+        result = detector.detect_acceptance_criteria_fields()
+
+        # Should have found criteria field from Task type
+        assert len(result) == 1
+        assert result[0]["name"] == "Acceptance Criteria"
\ No newline at end of file
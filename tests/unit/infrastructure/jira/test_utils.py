@@ -1,10 +1,12 @@
 """Tests for Jira utils."""
 import json
 import pytest
-import requests
+from requests.exceptions import HTTPError, ConnectionError as ReqConnectionError, Timeout
 from unittest.mock import Mock, patch
 import logging
+from types import MappingProxyType, SimpleNamespace
 
+from src.infrastructure.jira import utils as _utils
 from src.infrastructure.jira.utils import (
     get_issue_types,
     handle_http_error, 
@@ -12,173 +14,185 @@ from src.infrastructure.jira.utils import (
 )
 
 
+ISSUE_TYPES_PAYLOAD = MappingProxyType({
+    "projects": [{
+        "issuetypes": [
+            {"id": "1", "name": "Story", "description": "User story"},
+            {"id": "2", "name": "Task", "description": "Task"},
+            {"id": "3", "name": "Sub-task", "description": "Subtask"}
+        ]
+    }]
+})
+
+SINGLE_STORY_PAYLOAD = MappingProxyType({
+    "projects": [{
+        "issuetypes": [{"id": "1", "name": "Story"}]
+    }]
+})
+
+COMPLEX_ISSUE_TYPES_PAYLOAD = MappingProxyType({
+    "projects": [{
+        "issuetypes": [
+            {
+                "id": "10001",
+                "name": "Story",
+                "description": "A user story",
+                "iconUrl": "https://icon.url",
+                "subtask": False,
+                "fields": {"summary": {"required": True}}
+            },
+            {
+                "id": "10002", 
+                "name": "Sub-task",
+                "description": "A subtask",
+                "subtask": True,
+                "fields": {"summary": {"required": True}, "parent": {"required": True}}
+            }
+        ]
+    }]
+})
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in for error paths."""
+
+    __slots__ = ("status_code", "text", "_json")
+
+    def __init__(self, status_code=200, text="", json_data=None):
+        self.status_code = status_code
+        self.text = text
+        self._json = json_data
+
+    def json(self):
+        if isinstance(self._json, Exception):
+            raise self._json
+        return self._json
+
+    def raise_for_status(self):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def patched_logger():
+    """Patch the utils module logger for every test."""
+    with patch.object(_utils, 'logger') as mock_logger:
+        yield mock_logger
+
+
+@pytest.fixture(scope="module")
+def complex_error_payload():
+    """Complex Jira error body shared by the handle_http_error tests."""
+    return {
+        "errorMessages": [
+            "The issue type selected is invalid.",
+            "Field 'project' is required."
+        ],
+        "errors": {
+            "project": "Project is required",
+            "issuetype": "Issue type is invalid",
+            "customfield_10001": "Custom field error"
+        },
+        "warningMessages": ["This is a warning"],
+        "httpStatusCode": 400
+    }
+
+
 class TestGetIssueTypes:
     """Test get_issue_types function."""
 
-    def test_get_issue_types_success(self):
+    def test_get_issue_types_success(self, make_session):
         """Test successful retrieval of issue types."""
-        # Mock session and response
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [
-                    {"id": "1", "name": "Story", "description": "User story"},
-                    {"id": "2", "name": "Task", "description": "Task"},
-                    {"id": "3", "name": "Sub-task", "description": "Subtask"}
-                ]
-            }]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
+        mock_session, _ = make_session(ISSUE_TYPES_PAYLOAD)
         
         result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
         
         # Verify result
-        assert len(result) == 3
-        assert result[0]["name"] == "Story"
-        assert result[1]["name"] == "Task"
-        assert result[2]["name"] == "Sub-task"
+        assert tuple(t["name"] for t in result) == ("Story", "Task", "Sub-task")
         
         # Verify API call
         expected_url = "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=TEST&expand=projects.issuetypes"
         mock_session.get.assert_called_once_with(expected_url)
 
-    def test_get_issue_types_empty_projects(self):
+    def test_get_issue_types_empty_projects(self, make_session, patched_logger):
         """Test handling when no projects are returned."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"projects": []}
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
-        
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
-            
-            assert result == []
-            mock_logger.warning.assert_called_once_with("No se encontraron proyectos en createmeta")
-
-    def test_get_issue_types_no_projects_key(self):
+        mock_session, _ = make_session({"projects": []})
+        
+        result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
+
+        assert result == []
+        patched_logger.warning.assert_called_once_with("No se encontraron proyectos en createmeta")
+
+    def test_get_issue_types_no_projects_key(self, make_session, patched_logger):
         """Test handling when projects key is missing."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {}  # No projects key
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
-        
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
-            
-            assert result == []
-            mock_logger.warning.assert_called_once_with("No se encontraron proyectos en createmeta")
-
-    def test_get_issue_types_no_issuetypes(self):
+        mock_session, _ = make_session({})  # No projects key
+        
+        result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
+
+        assert result == []
+        patched_logger.warning.assert_called_once_with("No se encontraron proyectos en createmeta")
+
+    def test_get_issue_types_no_issuetypes(self, make_session):
         """Test handling when project has no issuetypes."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_session, _ = make_session({
             "projects": [{}]  # No issuetypes key
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
+        })
         
         result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
         
         assert result == []
 
-    def test_get_issue_types_http_error(self):
+    def test_get_issue_types_http_error(self, mock_session_response, patched_logger):
         """Test handling of HTTP errors."""
-        mock_session = Mock()
-        mock_session.get.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        mock_session, _ = mock_session_response
+        mock_session.get.side_effect = HTTPError("404 Not Found")
         
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", "INVALID")
-            
-            assert result == []
-            mock_logger.error.assert_called_once_with("Error obteniendo tipos de issue: %s", "404 Not Found")
+        result = get_issue_types(mock_session, "https://test.atlassian.net", "INVALID")
+
+        assert result == []
+        patched_logger.error.assert_called_once_with("Error obteniendo tipos de issue: %s", "404 Not Found")
 
-    def test_get_issue_types_connection_error(self):
+    def test_get_issue_types_connection_error(self, mock_session_response, patched_logger):
         """Test handling of connection errors."""
-        mock_session = Mock()
-        mock_session.get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        mock_session, _ = mock_session_response
+        mock_session.get.side_effect = ReqConnectionError("Connection failed")
         
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
-            
-            assert result == []
-            mock_logger.error.assert_called_once_with("Error obteniendo tipos de issue: %s", "Connection failed")
+        result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
+
+        assert result == []
+        patched_logger.error.assert_called_once_with("Error obteniendo tipos de issue: %s", "Connection failed")
 
-    def test_get_issue_types_json_decode_error(self):
+    def test_get_issue_types_json_decode_error(self, make_session, patched_logger):
         """Test handling of JSON decode errors."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
-        mock_session.get.return_value = mock_response
-        
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
-            
-            assert result == []
-            mock_logger.error.assert_called_once()
-
-    def test_get_issue_types_different_project_keys(self):
+        mock_session, _ = make_session(json_side_effect=json.JSONDecodeError("Invalid JSON", "doc", 0))
+        
+        result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
+
+        assert result == []
+        patched_logger.error.assert_called_once()
+
+    @pytest.mark.parametrize("project_key,expected_url", [
+        ("TEST", "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=TEST&expand=projects.issuetypes"),
+        ("PROJ", "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=PROJ&expand=projects.issuetypes"),
+        ("MY-PROJECT", "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=MY-PROJECT&expand=projects.issuetypes"),
+        ("A", "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=A&expand=projects.issuetypes"),
+        ("VERY-LONG-PROJECT-KEY", "https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys=VERY-LONG-PROJECT-KEY&expand=projects.issuetypes"),
+    ])
+    def test_get_issue_types_different_project_keys(self, make_session, project_key, expected_url):
         """Test with different project keys."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [{"id": "1", "name": "Story"}]
-            }]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
+        mock_session, _ = make_session(SINGLE_STORY_PAYLOAD)
         
-        # Test various project keys
-        project_keys = ["TEST", "PROJ", "MY-PROJECT", "A", "VERY-LONG-PROJECT-KEY"]
+        result = get_issue_types(mock_session, "https://test.atlassian.net", project_key)
         
-        for project_key in project_keys:
-            result = get_issue_types(mock_session, "https://test.atlassian.net", project_key)
-            
-            assert len(result) == 1
-            expected_url = f"https://test.atlassian.net/rest/api/3/issue/createmeta?projectKeys={project_key}&expand=projects.issuetypes"
-            mock_session.get.assert_called_with(expected_url)
+        assert len(result) == 1
+        mock_session.get.assert_called_once_with(expected_url)
 
-    def test_get_issue_types_complex_response(self):
+    def test_get_issue_types_complex_response(self, make_session):
         """Test with complex issue types response."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "projects": [{
-                "issuetypes": [
-                    {
-                        "id": "10001",
-                        "name": "Story",
-                        "description": "A user story",
-                        "iconUrl": "https://icon.url",
-                        "subtask": False,
-                        "fields": {"summary": {"required": True}}
-                    },
-                    {
-                        "id": "10002", 
-                        "name": "Sub-task",
-                        "description": "A subtask",
-                        "subtask": True,
-                        "fields": {"summary": {"required": True}, "parent": {"required": True}}
-                    }
-                ]
-            }]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
+        mock_session, _ = make_session(COMPLEX_ISSUE_TYPES_PAYLOAD)
         
         result = get_issue_types(mock_session, "https://test.atlassian.net", "TEST")
         
-        assert len(result) == 2
-        assert result[0]["subtask"] is False
-        assert result[1]["subtask"] is True
-        assert "fields" in result[0]
-        assert "fields" in result[1]
+        assert tuple((t["subtask"], "fields" in t) for t in result) == ((False, True), (True, True))
 
 
 class TestHandleHttpError:
@@ -186,15 +200,11 @@ class TestHandleHttpError:
 
     def test_handle_http_error_with_json_response(self):
         """Test handling HTTP error with JSON response."""
-        # Create mock exception with response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Create HTTP error with a fake response
+        mock_exception = HTTPError(response=FakeResponse(status_code=400, json_data={
             "errorMessages": ["Field 'summary' is required"],
             "errors": {"summary": "Summary is required"}
-        }
-        
-        mock_exception = Mock()
-        mock_exception.response = mock_response
+        }))
         
         mock_logger = Mock()
         
@@ -204,17 +214,15 @@ class TestHandleHttpError:
         mock_logger.error.assert_called_once()
         args = mock_logger.error.call_args[0]
         assert "Detalles del error" in args[0]
-        assert '"errorMessages"' in args[1]  # JSON content should be in the logged string
+        assert json.loads(args[1]).keys() == {"errorMessages", "errors"}
 
     def test_handle_http_error_with_text_response(self):
         """Test handling HTTP error with text response."""
-        mock_response = Mock()
-        mock_response.json.side_effect = ValueError("No JSON")  # JSON parsing fails
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request: Invalid field"
-        
-        mock_exception = Mock()
-        mock_exception.response = mock_response
+        mock_exception = HTTPError(response=FakeResponse(
+            status_code=400,
+            text="Bad Request: Invalid field",
+            json_data=ValueError("No JSON")  # JSON parsing fails
+        ))
         
         mock_logger = Mock()
         
@@ -229,8 +237,7 @@ class TestHandleHttpError:
 
     def test_handle_http_error_no_response(self):
         """Test handling error without response attribute."""
-        mock_exception = Mock(spec=[])  # No response attribute
-        mock_exception.response = None
+        mock_exception = SimpleNamespace(response=None)
         
         mock_logger = Mock()
         
@@ -256,15 +263,24 @@ class TestHandleHttpError:
             "Connection timeout"
         )
 
+    def test_handle_http_error_timeout(self):
+        """Test handling a request timeout, which carries no response."""
+        mock_logger = Mock()
+        
+        handle_http_error(Timeout("Timeout Error"), mock_logger)
+        
+        mock_logger.error.assert_called_once_with(
+            "Error de conexión: %s", 
+            "Timeout Error"
+        )
+
     def test_handle_http_error_json_parse_exception(self):
         """Test when JSON parsing itself raises an exception."""
-        mock_response = Mock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        
-        mock_exception = Mock()
-        mock_exception.response = mock_response
+        mock_exception = HTTPError(response=FakeResponse(
+            status_code=500,
+            text="Internal Server Error",
+            json_data=json.JSONDecodeError("Invalid JSON", "doc", 0)
+        ))
         
         mock_logger = Mock()
         
@@ -277,27 +293,9 @@ class TestHandleHttpError:
             "Internal Server Error"
         )
 
-    def test_handle_http_error_complex_json(self):
+    def test_handle_http_error_complex_json(self, complex_error_payload):
         """Test with complex JSON error response."""
-        complex_json = {
-            "errorMessages": [
-                "The issue type selected is invalid.",
-                "Field 'project' is required."
-            ],
-            "errors": {
-                "project": "Project is required",
-                "issuetype": "Issue type is invalid",
-                "customfield_10001": "Custom field error"
-            },
-            "warningMessages": ["This is a warning"],
-            "httpStatusCode": 400
-        }
-        
-        mock_response = Mock()
-        mock_response.json.return_value = complex_json
-        
-        mock_exception = Mock()
-        mock_exception.response = mock_response
+        mock_exception = HTTPError(response=FakeResponse(status_code=400, json_data=complex_error_payload))
         
         mock_logger = Mock()
         
@@ -306,142 +304,109 @@ class TestHandleHttpError:
         # Verify complex JSON was logged
         mock_logger.error.assert_called_once()
         args = mock_logger.error.call_args[0]
-        logged_json = args[1]
+        parsed = json.loads(args[1])
         
         # Verify all complex fields are present
-        assert '"errorMessages"' in logged_json
-        assert '"errors"' in logged_json
-        assert '"warningMessages"' in logged_json
-        assert '"httpStatusCode"' in logged_json
-
+        assert {"errorMessages", "errors", "warningMessages", "httpStatusCode"} <= parsed.keys()
+        assert parsed == complex_error_payload
 
 class TestValidateIssueExists:
     """Test validate_issue_exists function."""
 
-    def test_validate_issue_exists_success(self):
+    def test_validate_issue_exists_success(self, mock_session_response):
         """Test successful issue validation."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
+        mock_session, mock_response = mock_session_response
         
         result = validate_issue_exists(mock_session, "https://test.atlassian.net", "TEST-123")
         
         assert result is True
         mock_session.get.assert_called_once_with("https://test.atlassian.net/rest/api/3/issue/TEST-123")
 
-    def test_validate_issue_exists_not_found(self):
+    def test_validate_issue_exists_not_found(self, mock_session_response, patched_logger):
         """Test issue not found (404)."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 404
-        
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
+        mock_session, _ = mock_session_response
+        http_error = HTTPError(response=FakeResponse(status_code=404))
         
         mock_session.get.side_effect = http_error
         
-        with patch('src.infrastructure.jira.utils.logger') as mock_logger:
-            result = validate_issue_exists(mock_session, "https://test.atlassian.net", "TEST-999")
-            
-            assert result is False
-            mock_logger.error.assert_called_once_with("Issue %s no encontrado", "TEST-999")
+        result = validate_issue_exists(mock_session, "https://test.atlassian.net", "TEST-999")
 
-    def test_validate_issue_exists_empty_key(self):
+        assert result is False
+        patched_logger.error.assert_called_once_with("Issue %s no encontrado", "TEST-999")
+
+    def test_validate_issue_exists_empty_key(self, mock_session_response):
         """Test with empty issue key."""
-        mock_session = Mock()
+        mock_session, _ = mock_session_response
         
         result = validate_issue_exists(mock_session, "https://test.atlassian.net", "")
         
         assert result is True  # Empty key is considered valid
         mock_session.get.assert_not_called()
 
-    def test_validate_issue_exists_none_key(self):
+    def test_validate_issue_exists_none_key(self, mock_session_response):
         """Test with None issue key."""
-        mock_session = Mock()
+        mock_session, _ = mock_session_response
         
         result = validate_issue_exists(mock_session, "https://test.atlassian.net", None)
         
         assert result is True  # None key is considered valid
         mock_session.get.assert_not_called()
 
-    def test_validate_issue_exists_http_error_not_404(self):
+    def test_validate_issue_exists_http_error_not_404(self, mock_session_response):
         """Test HTTP error other than 404."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 403
-        
-        http_error = requests.exceptions.HTTPError("Forbidden")
-        http_error.response = mock_response
+        mock_session, _ = mock_session_response
+        http_error = HTTPError("Forbidden", response=FakeResponse(status_code=403))
         
         mock_session.get.side_effect = http_error
         
-        with pytest.raises(requests.exceptions.HTTPError):
+        with pytest.raises(HTTPError, match="Forbidden"):
             validate_issue_exists(mock_session, "https://test.atlassian.net", "TEST-123")
 
-    def test_validate_issue_exists_connection_error(self):
+    def test_validate_issue_exists_connection_error(self, mock_session_response):
         """Test connection error."""
-        mock_session = Mock()
-        mock_session.get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        mock_session, _ = mock_session_response
+        mock_session.get.side_effect = ReqConnectionError("Connection failed")
         
-        with pytest.raises(requests.exceptions.ConnectionError):
+        with pytest.raises(ReqConnectionError, match="Connection failed"):
             validate_issue_exists(mock_session, "https://test.atlassian.net", "TEST-123")
 
-    def test_validate_issue_exists_different_issue_keys(self):
+    @pytest.mark.parametrize("issue_key,expected_url", [
+        ("TEST-1", "https://test.atlassian.net/rest/api/3/issue/TEST-1"),
+        ("PROJECT-999", "https://test.atlassian.net/rest/api/3/issue/PROJECT-999"),
+        ("ABC-12345", "https://test.atlassian.net/rest/api/3/issue/ABC-12345"),
+        ("MY-PROJ-1", "https://test.atlassian.net/rest/api/3/issue/MY-PROJ-1"),
+        ("A-1", "https://test.atlassian.net/rest/api/3/issue/A-1"),
+    ])
+    def test_validate_issue_exists_different_issue_keys(self, mock_session_response, issue_key, expected_url):
         """Test with different issue key formats."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
-        
-        issue_keys = [
-            "TEST-1",
-            "PROJECT-999", 
-            "ABC-12345",
-            "MY-PROJ-1",
-            "A-1"
-        ]
+        mock_session, _ = mock_session_response
+        
+        result = validate_issue_exists(mock_session, "https://test.atlassian.net", issue_key)
         
-        for issue_key in issue_keys:
-            result = validate_issue_exists(mock_session, "https://test.atlassian.net", issue_key)
-            
-            assert result is True
-            expected_url = f"https://test.atlassian.net/rest/api/3/issue/{issue_key}"
-            mock_session.get.assert_called_with(expected_url)
+        assert result is True
+        mock_session.get.assert_called_once_with(expected_url)
 
-    def test_validate_issue_exists_different_base_urls(self):
+    @pytest.mark.parametrize("base_url,expected_url", [
+        ("https://test.atlassian.net", "https://test.atlassian.net/rest/api/3/issue/TEST-123"),
+        ("https://company.atlassian.net", "https://company.atlassian.net/rest/api/3/issue/TEST-123"),
+        ("http://localhost:8080", "http://localhost:8080/rest/api/3/issue/TEST-123"),
+        ("https://jira.example.com", "https://jira.example.com/rest/api/3/issue/TEST-123"),
+    ])
+    def test_validate_issue_exists_different_base_urls(self, mock_session_response, base_url, expected_url):
         """Test with different base URLs."""
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
-        
-        base_urls = [
-            "https://test.atlassian.net",
-            "https://company.atlassian.net", 
-            "http://localhost:8080",
-            "https://jira.example.com"
-        ]
+        mock_session, _ = mock_session_response
         
-        for base_url in base_urls:
-            result = validate_issue_exists(mock_session, base_url, "TEST-123")
-            
-            assert result is True
-            expected_url = f"{base_url}/rest/api/3/issue/TEST-123"
-            mock_session.get.assert_called_with(expected_url)
-
+        result = validate_issue_exists(mock_session, base_url, "TEST-123")
+        
+        assert result is True
+        mock_session.get.assert_called_once_with(expected_url)
 
 class TestUtilsIntegration:
     """Integration tests for utils functions."""
 
-    def test_utils_with_real_session_structure(self):
-        """Test utils functions with realistic session mock."""
-        # Create a more realistic session mock
-        session = Mock(spec=requests.Session)
-        
-        # Test get_issue_types
-        mock_response = Mock()
-        mock_response.json.return_value = {
+    def test_integration_get_issue_types(self, make_session):
+        """Test get_issue_types with a session mock specced on requests.Session."""
+        session, _ = make_session({
             "projects": [{
                 "key": "TEST",
                 "issuetypes": [
@@ -449,35 +414,16 @@ class TestUtilsIntegration:
                     {"id": "2", "name": "Task"}
                 ]
             }]
-        }
-        mock_response.raise_for_status.return_value = None
-        session.get.return_value = mock_response
+        })
         
         issue_types = get_issue_types(session, "https://test.atlassian.net", "TEST")
-        assert len(issue_types) == 2
-        
-        # Test validate_issue_exists
-        session.reset_mock()
-        mock_response.raise_for_status.return_value = None
-        session.get.return_value = mock_response
         
-        exists = validate_issue_exists(session, "https://test.atlassian.net", "TEST-1")
-        assert exists is True
+        assert len(issue_types) == 2
 
-    def test_error_handling_consistency(self):
-        """Test that error handling is consistent across functions."""
-        mock_logger = Mock()
-        
-        # Test different types of exceptions
-        exceptions = [
-            requests.exceptions.HTTPError("HTTP Error"),
-            requests.exceptions.ConnectionError("Connection Error"),
-            requests.exceptions.Timeout("Timeout Error"),
-            Exception("Generic Error")
-        ]
+    def test_integration_validate_issue_exists(self, mock_session_response):
+        """Test validate_issue_exists with a session mock specced on requests.Session."""
+        session, _ = mock_session_response
         
-        for exc in exceptions:
-            handle_http_error(exc, mock_logger)
+        exists = validate_issue_exists(session, "https://test.atlassian.net", "TEST-1")
         
-        # Should have logged all errors
-        assert mock_logger.error.call_count == len(exceptions)
\ No newline at end of file
+        assert exists is True
@@ -1,9 +1,7 @@
 """Tests for Settings."""
 import pytest
-import os
-import tempfile
-from unittest.mock import patch, mock_open
 from pathlib import Path
+from types import MappingProxyType
 from pydantic import ValidationError
 
 from src.infrastructure.settings import Settings
@@ -12,13 +10,91 @@ from src.infrastructure.settings import Settings
 # Path to test environment file
 TEST_ENV_FILE = Path(__file__).parent.parent.parent.parent / ".env.test"
 
+# Required settings as environment variables
+BASE_ENV = MappingProxyType({
+    'JIRA_URL': 'https://test.atlassian.net',
+    'JIRA_EMAIL': 'test@example.com',
+    'JIRA_API_TOKEN': 'test-token',
+    'PROJECT_KEY': 'TEST'
+})
+
+# Settings overridden with non-default values
+ALL_FIELDS_ENV = MappingProxyType({
+    'JIRA_URL': 'https://custom.atlassian.net',
+    'JIRA_EMAIL': 'custom@example.com',
+    'JIRA_API_TOKEN': 'custom-token',
+    'PROJECT_KEY': 'CUSTOM',
+    'DEFAULT_ISSUE_TYPE': 'Task',
+    'SUBTASK_ISSUE_TYPE': 'Subtarea',
+    # batch_size removed
+    'DRY_RUN': 'true',
+    'ACCEPTANCE_CRITERIA_FIELD': 'customfield_10001',
+    'INPUT_DIRECTORY': 'custom_input',
+    'LOGS_DIRECTORY': 'custom_logs',
+    'PROCESSED_DIRECTORY': 'custom_processed',
+    'ROLLBACK_ON_SUBTASK_FAILURE': 'true',
+    'FEATURE_ISSUE_TYPE': 'Epic',
+    'FEATURE_REQUIRED_FIELDS': '{"summary": "test"}'
+})
+
+# Required settings plus custom directories
+CUSTOM_DIRS_ENV = MappingProxyType({
+    **BASE_ENV,
+    'INPUT_DIRECTORY': '/custom/input',
+    'LOGS_DIRECTORY': '/custom/logs',
+    'PROCESSED_DIRECTORY': '/custom/processed'
+})
+
+# Required field values, validated directly without reading env sources
+BASE_VALUES = {
+    'jira_url': 'https://test.atlassian.net',
+    'jira_email': 'test@example.com',
+    'jira_api_token': 'test-token',
+    'project_key': 'TEST'
+}
+
+# String representations accepted for boolean fields
+BOOL_CASES = [
+    ('true', True),
+    ('True', True),
+    ('TRUE', True),
+    ('1', True),
+    ('yes', True),
+    ('false', False),
+    ('False', False),
+    ('FALSE', False),
+    ('0', False),
+    ('no', False)
+]
+
+
+@pytest.fixture(scope="session")
+def base_settings():
+    """Settings loaded once from the test environment file."""
+    return Settings(_env_file=str(TEST_ENV_FILE))
+
+
+def set_env(monkeypatch, env):
+    """Set every variable in env for the current test."""
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Monkeypatch with every Settings variable removed from the environment."""
+    for name in Settings.model_fields:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    yield monkeypatch
+
 
 class TestSettingsInit:
     """Test Settings initialization."""
 
-    def test_init_with_required_fields(self):
+    def test_init_with_required_fields(self, base_settings):
         """Test initialization using test environment file."""
-        settings = Settings(_env_file=str(TEST_ENV_FILE))
+        settings = base_settings
         
         assert settings.jira_url == 'https://test.atlassian.net'
         assert settings.jira_email == 'test@example.com'
@@ -37,72 +113,55 @@ class TestSettingsInit:
         assert settings.feature_issue_type == 'Feature'
         assert settings.feature_required_fields == ''  # Empty string in test file
 
-    def test_init_with_all_fields(self):
+    def test_init_with_all_fields(self, monkeypatch):
         """Test initialization with all fields provided."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://custom.atlassian.net',
-            'JIRA_EMAIL': 'custom@example.com',
-            'JIRA_API_TOKEN': 'custom-token',
-            'PROJECT_KEY': 'CUSTOM',
-            'DEFAULT_ISSUE_TYPE': 'Task',
-            'SUBTASK_ISSUE_TYPE': 'Subtarea',
-            # batch_size removed
-            'DRY_RUN': 'true',
-            'ACCEPTANCE_CRITERIA_FIELD': 'customfield_10001',
-            'INPUT_DIRECTORY': 'custom_input',
-            'LOGS_DIRECTORY': 'custom_logs',
-            'PROCESSED_DIRECTORY': 'custom_processed',
-            'ROLLBACK_ON_SUBTASK_FAILURE': 'true',
-            'FEATURE_ISSUE_TYPE': 'Epic',
-            'FEATURE_REQUIRED_FIELDS': '{"summary": "test"}'
-        }):
-            settings = Settings()
-            
-            assert settings.jira_url == 'https://custom.atlassian.net'
-            assert settings.jira_email == 'custom@example.com'
-            assert settings.jira_api_token == 'custom-token'
-            assert settings.project_key == 'CUSTOM'
-            assert settings.default_issue_type == 'Task'
-            assert settings.subtask_issue_type == 'Subtarea'
-            assert settings.dry_run is True
-            assert settings.acceptance_criteria_field == 'customfield_10001'
-            assert settings.input_directory == 'custom_input'
-            assert settings.logs_directory == 'custom_logs'
-            assert settings.processed_directory == 'custom_processed'
-            assert settings.rollback_on_subtask_failure is True
-            assert settings.feature_issue_type == 'Epic'
-            assert settings.feature_required_fields == '{"summary": "test"}'
-
-    def test_init_missing_required_fields(self):
+        set_env(monkeypatch, ALL_FIELDS_ENV)
+        settings = Settings()
+        
+        assert settings.jira_url == 'https://custom.atlassian.net'
+        assert settings.jira_email == 'custom@example.com'
+        assert settings.jira_api_token == 'custom-token'
+        assert settings.project_key == 'CUSTOM'
+        assert settings.default_issue_type == 'Task'
+        assert settings.subtask_issue_type == 'Subtarea'
+        assert settings.dry_run is True
+        assert settings.acceptance_criteria_field == 'customfield_10001'
+        assert settings.input_directory == 'custom_input'
+        assert settings.logs_directory == 'custom_logs'
+        assert settings.processed_directory == 'custom_processed'
+        assert settings.rollback_on_subtask_failure is True
+        assert settings.feature_issue_type == 'Epic'
+        assert settings.feature_required_fields == '{"summary": "test"}'
+
+    def test_init_missing_required_fields(self, clean_env):
         """Test that missing required fields raise ValidationError."""
-        # Clear environment and don't use any env file
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValidationError) as exc_info:
-                Settings(_env_file=None)
-            
-            # Should mention missing required fields
-            errors = exc_info.value.errors()
-            required_fields = ['jira_url', 'jira_email', 'jira_api_token', 'project_key']
-            
-            # Check that all required fields are mentioned in errors
-            error_fields = [error['loc'][0] for error in errors]
-            for field in required_fields:
-                assert field in error_fields
-
-    def test_init_partial_required_fields(self):
+        # Clean environment and don't use any env file
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(_env_file=None)
+        
+        # Should mention missing required fields
+        errors = exc_info.value.errors()
+        required_fields = ['jira_url', 'jira_email', 'jira_api_token', 'project_key']
+        
+        # Check that all required fields are mentioned in errors
+        error_fields = [error['loc'][0] for error in errors]
+        for field in required_fields:
+            assert field in error_fields
+
+    def test_init_partial_required_fields(self, clean_env):
         """Test with some required fields missing."""
-        with patch.dict(os.environ, {
+        set_env(clean_env, {
             'JIRA_URL': 'https://test.atlassian.net',
             'JIRA_EMAIL': 'test@example.com'
             # Missing JIRA_API_TOKEN and PROJECT_KEY
-        }, clear=True):
-            with pytest.raises(ValidationError) as exc_info:
-                Settings(_env_file=None)
-            
-            errors = exc_info.value.errors()
-            error_fields = [error['loc'][0] for error in errors]
-            assert 'jira_api_token' in error_fields
-            assert 'project_key' in error_fields
+        })
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(_env_file=None)
+        
+        errors = exc_info.value.errors()
+        error_fields = [error['loc'][0] for error in errors]
+        assert 'jira_api_token' in error_fields
+        assert 'project_key' in error_fields
 
 
 class TestSettingsTypes:
@@ -110,60 +169,29 @@ class TestSettingsTypes:
 
     # batch_size validation tests removed
 
-    def test_boolean_validation(self):
+    @pytest.mark.parametrize("str_value,expected_bool", BOOL_CASES)
+    def test_boolean_validation(self, str_value, expected_bool):
         """Test boolean field validation."""
-        base_env = {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }
+        settings = Settings.model_validate({**BASE_VALUES, 'dry_run': str_value})
         
-        # Test various boolean representations
-        boolean_values = [
-            ('true', True),
-            ('True', True),
-            ('TRUE', True),
-            ('1', True),
-            ('yes', True),
-            ('false', False),
-            ('False', False),
-            ('FALSE', False),
-            ('0', False),
-            ('no', False)
-        ]
-        
-        for str_value, expected_bool in boolean_values:
-            with patch.dict(os.environ, {**base_env, 'DRY_RUN': str_value}):
-                settings = Settings()
-                assert settings.dry_run == expected_bool
-                assert isinstance(settings.dry_run, bool)
-
-    def test_url_validation(self):
+        assert settings.dry_run is expected_bool
+
+    @pytest.mark.parametrize("url", [
+        'https://company.atlassian.net',
+        'http://localhost:8080',
+        'https://jira.example.com',
+        'https://my-jira.atlassian.net:443'
+    ])
+    def test_url_validation(self, url):
         """Test URL format validation."""
-        base_env = {
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }
+        settings = Settings.model_validate({**BASE_VALUES, 'jira_url': url})
         
-        # Valid URLs
-        valid_urls = [
-            'https://company.atlassian.net',
-            'http://localhost:8080',
-            'https://jira.example.com',
-            'https://my-jira.atlassian.net:443'
-        ]
-        
-        for url in valid_urls:
-            with patch.dict(os.environ, {**base_env, 'JIRA_URL': url}):
-                settings = Settings()
-                assert settings.jira_url == url
+        assert settings.jira_url == url
 
-    def test_optional_fields_none(self):
+    def test_optional_fields_none(self, base_settings):
         """Test that optional fields can be None."""
         # Use test env file which has empty strings for optional fields
-        settings = Settings(_env_file=str(TEST_ENV_FILE))
+        settings = base_settings
         
         # These should be empty strings in test file (pydantic treats empty strings as valid)
         assert settings.acceptance_criteria_field == ''
@@ -187,21 +215,15 @@ DRY_RUN=true
 """
         env_file.write_text(env_content.strip())
         
-        # Change to temp directory so .env file is found
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            settings = Settings()
-            
-            assert settings.jira_url == 'https://envfile.atlassian.net'
-            assert settings.jira_email == 'envfile@example.com'
-            assert settings.jira_api_token == 'envfile-token'
-            assert settings.project_key == 'ENVFILE'
-            assert settings.dry_run is True
-        finally:
-            os.chdir(original_cwd)
-
-    def test_env_var_overrides_file(self, temp_dir):
+        settings = Settings(_env_file=str(env_file))
+        
+        assert settings.jira_url == 'https://envfile.atlassian.net'
+        assert settings.jira_email == 'envfile@example.com'
+        assert settings.jira_api_token == 'envfile-token'
+        assert settings.project_key == 'ENVFILE'
+        assert settings.dry_run is True
+
+    def test_env_var_overrides_file(self, temp_dir, monkeypatch):
         """Test that environment variables override .env file."""
         # Create .env file
         env_file = temp_dir / '.env'
@@ -215,61 +237,43 @@ PROJECT_KEY=FILE
         env_file.write_text(env_content.strip())
         
         # Set environment variable that should override
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            settings = Settings()
+        set_env(monkeypatch, {'PROJECT_KEY': 'ENVVAR'})
+        settings = Settings(_env_file=str(env_file))
 
-            # These should come from file
-            assert settings.jira_url == 'https://file.atlassian.net'
-            assert settings.jira_email == 'file@example.com'
+        # These should come from file
+        assert settings.jira_url == 'https://file.atlassian.net'
+        assert settings.jira_email == 'file@example.com'
 
-            # batch_size test removed
-        finally:
-            os.chdir(original_cwd)
+        # This one is overridden by the environment
+        assert settings.project_key == 'ENVVAR'
 
 
 class TestSettingsModification:
     """Test Settings modification after initialization."""
 
-    def test_settings_are_mutable(self):
-        """Test that settings can be modified after creation."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            settings = Settings()
-            
-            # Modify settings
-            original_project = settings.project_key
-            settings.project_key = 'MODIFIED'
-            
-            assert original_project == 'TEST'
-            assert settings.project_key == 'MODIFIED'
-
-    def test_modify_dry_run(self):
-        """Test modifying dry_run mode."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            settings = Settings()
-            
-            assert settings.dry_run is False  # Default
-            settings.dry_run = True
-            assert settings.dry_run is True
+    def test_settings_are_mutable(self, base_settings):
+        """Test that settings can be modified after creation, as the CLI options do."""
+        settings = base_settings.model_copy()
+        
+        settings.project_key = 'MODIFIED'
+        settings.dry_run = True
+        
+        assert (settings.project_key, settings.dry_run) == ('MODIFIED', True)
+        assert (base_settings.project_key, base_settings.dry_run) == ('TEST', False)
 
+    def test_settings_model_copy(self, base_settings):
+        """Test deriving updated settings with model_copy(update=...)."""
+        updated = base_settings.model_copy(update={'project_key': 'MODIFIED', 'dry_run': True})
+        
+        assert (updated.project_key, updated.dry_run) == ('MODIFIED', True)
+        assert (base_settings.project_key, base_settings.dry_run) == ('TEST', False)
 
 class TestSettingsDefaults:
     """Test default values for Settings."""
 
-    def test_all_defaults(self):
+    def test_all_defaults(self, base_settings):
         """Test all default values are as expected."""
-        settings = Settings(_env_file=str(TEST_ENV_FILE))
+        settings = base_settings
         
         # Test all values from test file
         assert settings.default_issue_type == 'Story'
@@ -283,110 +287,60 @@ class TestSettingsDefaults:
         assert settings.feature_issue_type == 'Feature'
         assert settings.feature_required_fields == ''  # Empty in test file
 
-    def test_custom_directories(self):
+    def test_custom_directories(self, monkeypatch):
         """Test custom directory settings."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST',
-            'INPUT_DIRECTORY': '/custom/input',
-            'LOGS_DIRECTORY': '/custom/logs',
-            'PROCESSED_DIRECTORY': '/custom/processed'
-        }):
-            settings = Settings()
-            
-            assert settings.input_directory == '/custom/input'
-            assert settings.logs_directory == '/custom/logs'
-            assert settings.processed_directory == '/custom/processed'
+        set_env(monkeypatch, CUSTOM_DIRS_ENV)
+        settings = Settings()
+        
+        assert settings.input_directory == '/custom/input'
+        assert settings.logs_directory == '/custom/logs'
+        assert settings.processed_directory == '/custom/processed'
 
 
 class TestSettingsValidation:
     """Test Settings field validation."""
 
-    def test_empty_string_fields(self):
+    def test_empty_string_fields(self, monkeypatch):
         """Test handling of empty string fields."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': '',  # Empty string
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            # Pydantic allows empty strings by default, so this will not raise
-            settings = Settings(_env_file=None)
-            assert settings.jira_url == ''
-
-    def test_whitespace_fields(self):
+        set_env(monkeypatch, {**BASE_ENV, 'JIRA_URL': ''})  # Empty string
+        # Pydantic allows empty strings by default, so this will not raise
+        settings = Settings(_env_file=None)
+        assert settings.jira_url == ''
+
+    def test_whitespace_fields(self, monkeypatch):
         """Test handling of whitespace-only fields."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': '   ',  # Whitespace only
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'test-token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            # Pydantic allows whitespace strings by default
-            settings = Settings(_env_file=None)
-            assert settings.jira_url == '   '
+        set_env(monkeypatch, {**BASE_ENV, 'JIRA_URL': '   '})  # Whitespace only
+        # Pydantic allows whitespace strings by default
+        settings = Settings(_env_file=None)
+        assert settings.jira_url == '   '
 
 
 
 class TestSettingsEdgeCases:
     """Test edge cases for Settings."""
 
-    def test_unicode_values(self):
-        """Test handling of unicode values."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'tëst@éxàmplé.com',  # Unicode characters
-            'JIRA_API_TOKEN': 'tökèn-with-ûnicödé',
-            'PROJECT_KEY': 'TËST'
-        }):
-            settings = Settings()
-            
-            assert settings.jira_email == 'tëst@éxàmplé.com'
-            assert settings.jira_api_token == 'tökèn-with-ûnicödé'
-            assert settings.project_key == 'TËST'
-
-    def test_very_long_values(self):
-        """Test handling of very long string values."""
-        long_value = 'x' * 1000
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': long_value,
-            'PROJECT_KEY': 'TEST'
-        }):
-            settings = Settings()
-            
-            assert settings.jira_api_token == long_value
-            assert len(settings.jira_api_token) == 1000
-
-    def test_special_characters(self):
-        """Test handling of special characters."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'token!@#$%^&*()_+-={}[]|\\:";\'<>?,./~`',
-            'PROJECT_KEY': 'TEST-123_ABC'
-        }):
-            settings = Settings()
-            
-            assert 'token!@#$%^&*()_+-={}[]|\\:";\'<>?,./~`' in settings.jira_api_token
-            assert settings.project_key == 'TEST-123_ABC'
-
-    def test_settings_repr(self):
+    @pytest.mark.parametrize("field,value", [
+        ('jira_email', 'tëst@éxàmplé.com'),  # Unicode characters
+        ('jira_api_token', 'tökèn-with-ûnicödé'),
+        ('project_key', 'TËST'),
+        ('jira_api_token', 'x' * 1000),  # Very long value
+        ('jira_api_token', 'token!@#$%^&*()_+-={}[]|\\:";\'<>?,./~`'),  # Special characters
+        ('project_key', 'TEST-123_ABC')
+    ])
+    def test_string_values_round_trip(self, field, value):
+        """Test that unusual string values are kept as given."""
+        settings = Settings.model_validate({**BASE_VALUES, field: value})
+        
+        assert getattr(settings, field) == value
+
+    def test_settings_repr(self, monkeypatch):
         """Test that Settings can be represented as string without exposing secrets."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@example.com',
-            'JIRA_API_TOKEN': 'secret-token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            settings = Settings()
-            
-            # Convert to string (should not raise error)
-            settings_str = str(settings)
-            assert isinstance(settings_str, str)
-            
-            # Should contain some field names but may hide sensitive values
-            assert 'Settings' in settings_str or 'jira_url' in settings_str
\ No newline at end of file
+        set_env(monkeypatch, {**BASE_ENV, 'JIRA_API_TOKEN': 'secret-token'})
+        settings = Settings()
+        
+        # Convert to string (should not raise error)
+        settings_str = str(settings)
+        assert isinstance(settings_str, str)
+        
+        # Should contain some field names but may hide sensitive values
+        assert 'Settings' in settings_str or 'jira_url' in settings_str
\ No newline at end of file
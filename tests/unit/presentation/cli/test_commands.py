@@ -1,195 +1,184 @@
 """Tests for CLI commands."""
 import pytest
-import sys
-import logging
 import json
-import requests
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
-from click.testing import CliRunner
+import logging
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, DEFAULT
 from pydantic import ValidationError
 
 from src.presentation.cli.commands import (
     setup_logging, 
-    safe_init_settings
+    safe_init_settings,
+    _detect_jira_configuration
 )
 from src.infrastructure.settings import Settings
 
 
+# Validation errors shared by TestSafeInitSettings, built once at import
+_MISSING_ERROR = ValidationError.from_exception_data('ValidationError', [
+    {'type': 'missing', 'loc': ('jira_url',), 'msg': 'Field required'}
+])
+_STRING_TYPE_ERROR = ValidationError.from_exception_data('ValidationError', [
+    {'type': 'string_type', 'loc': ('project_key',), 'msg': 'Input should be a valid string'}
+])
+
+
+@pytest.fixture
+def mock_settings_cls():
+    """Patch the Settings class looked up by safe_init_settings."""
+    with patch('src.presentation.cli.commands.Settings', new_callable=Mock) as settings_cls:
+        yield settings_cls
+
+
+@pytest.fixture
+def mock_click_io():
+    """Patch click.confirm, click.echo and sys.exit as used by safe_init_settings."""
+    with patch.multiple('src.presentation.cli.commands.click', confirm=DEFAULT, echo=DEFAULT,
+                        new_callable=Mock) as click_mocks, \
+         patch('src.presentation.cli.commands.sys.exit', new_callable=Mock) as mock_exit:
+        yield SimpleNamespace(confirm=click_mocks['confirm'], echo=click_mocks['echo'], exit=mock_exit)
+
+
 class TestSafeInitSettings:
     """Test safe_init_settings function."""
 
-    @patch('src.presentation.cli.commands.Settings')
-    def test_safe_init_settings_success(self, mock_settings_class):
+    def test_safe_init_settings_success(self, mock_settings_cls):
         """Test successful settings initialization."""
-        mock_settings = Mock()
-        mock_settings_class.return_value = mock_settings
+        mock_settings = Mock(spec=Settings)
+        mock_settings_cls.return_value = mock_settings
         
         result = safe_init_settings()
         
         assert result == mock_settings
-        mock_settings_class.assert_called_once()
+        mock_settings_cls.assert_called_once()
 
-    @patch('src.presentation.cli.commands.Settings')
-    @patch('src.presentation.cli.commands.click.confirm')
-    @patch('src.presentation.cli.commands.click.echo')
-    @patch('src.presentation.cli.commands.sys.exit')
-    def test_safe_init_settings_validation_error_interactive_no(self, mock_exit, mock_echo, mock_confirm, mock_settings_class):
+    def test_safe_init_settings_validation_error_interactive_no(self, mock_settings_cls, mock_click_io):
         """Test ValidationError with interactive configuration rejection."""
-        # Create a ValidationError with missing fields
-        validation_error = ValidationError.from_exception_data('ValidationError', [
-            {'type': 'missing', 'loc': ('jira_url',), 'msg': 'Field required'}
-        ])
-        
-        mock_settings_class.side_effect = validation_error
-        mock_confirm.return_value = False
+        mock_settings_cls.side_effect = _MISSING_ERROR
+        mock_click_io.confirm.return_value = False
         
         safe_init_settings()
         
-        mock_echo.assert_any_call("[ERROR] Configuracion faltante.", err=True)
-        mock_exit.assert_called_once_with(1)
-
-    @patch('src.presentation.cli.commands.sys.exit')
-    @patch('src.presentation.cli.commands.click.echo')
-    @patch('src.presentation.cli.commands.click.confirm')
-    @patch('src.presentation.cli.commands.Settings')
-    def test_safe_init_settings_validation_error_non_missing(self, mock_settings_class, mock_confirm, mock_echo, mock_exit):
+        mock_click_io.echo.assert_any_call("[ERROR] Configuracion faltante.", err=True)
+        mock_click_io.exit.assert_called_once_with(1)
+
+    def test_safe_init_settings_validation_error_non_missing(self, mock_settings_cls, mock_click_io):
         """Test ValidationError with non-missing error types."""
-        # Create a ValidationError with non-missing error type 
-        validation_error = ValidationError.from_exception_data('ValidationError', [
-            {'type': 'string_type', 'loc': ('project_key',), 'msg': 'Input should be a valid string'}
-        ])
-        
-        mock_settings_class.side_effect = validation_error
-        mock_confirm.return_value = False  # User declines interactive config
+        mock_settings_cls.side_effect = _STRING_TYPE_ERROR
+        mock_click_io.confirm.return_value = False  # User declines interactive config
         
         safe_init_settings()
         
         # Should still handle as missing fields scenario and exit
-        mock_echo.assert_any_call("[ERROR] Configuracion faltante.", err=True)
-        mock_exit.assert_called_once_with(1)
+        mock_click_io.echo.assert_any_call("[ERROR] Configuracion faltante.", err=True)
+        mock_click_io.exit.assert_called_once_with(1)
+
+
+@pytest.fixture
+def reset_logging(tmp_path):
+    """Run setup_logging against real logging, restoring root and external loggers afterwards."""
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    external = {name: logging.getLogger(name).level for name in ("urllib3", "requests")}
+    logs_dir = tmp_path / "logs"
+    yield SimpleNamespace(settings=SimpleNamespace(logs_directory=str(logs_dir)), logs_dir=logs_dir)
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+    for name, level in external.items():
+        logging.getLogger(name).setLevel(level)
 
 
 class TestSetupLogging:
     """Test setup_logging function."""
 
-    def test_setup_logging_default_level(self):
-        """Test logging setup with default level."""
-        settings = Mock()
-        settings.logs_directory = "test_logs"
-        
-        with patch('src.presentation.cli.commands.logging.basicConfig') as mock_config:
-            with patch('src.presentation.cli.commands.Path') as mock_path_class:
-                with patch('src.presentation.cli.commands.logging.FileHandler') as mock_file_handler:
-                    with patch('src.presentation.cli.commands.logging.StreamHandler') as mock_stream_handler:
-                        mock_logs_dir = Mock()
-                        mock_path_class.return_value = mock_logs_dir
-                        mock_logs_dir.mkdir = Mock()
-                        mock_log_file = Mock()
-                        mock_log_file.__str__ = Mock(return_value="test_logs/jira_batch.log")
-                        mock_logs_dir.__truediv__ = Mock(return_value=mock_log_file)
-                        
-                        setup_logging(settings, "INFO")
-                        
-                        # Verify logging configuration
-                        mock_config.assert_called_once()
-                        config_kwargs = mock_config.call_args[1]
-                        assert config_kwargs['level'] == 20  # logging.INFO
-
-    def test_setup_logging_different_levels(self):
-        """Test logging setup with different levels."""
-        settings = Mock()
-        settings.logs_directory = "test_logs"
-        
-        levels = ["DEBUG", "WARNING", "ERROR"]
-        expected_levels = [10, 30, 40]  # logging constants
+    @pytest.mark.parametrize("level", ("DEBUG", "INFO", "WARNING", "ERROR"))
+    def test_setup_logging_level(self, reset_logging, level):
+        """Test logging setup with each supported level."""
+        setup_logging(reset_logging.settings, level)
         
-        for level, expected in zip(levels, expected_levels):
-            with patch('src.presentation.cli.commands.logging.basicConfig') as mock_config:
-                with patch('src.presentation.cli.commands.Path') as mock_path_class:
-                    with patch('src.presentation.cli.commands.logging.FileHandler') as mock_file_handler:
-                        with patch('src.presentation.cli.commands.logging.StreamHandler') as mock_stream_handler:
-                            mock_logs_dir = Mock()
-                            mock_path_class.return_value = mock_logs_dir
-                            mock_logs_dir.mkdir = Mock()
-                            mock_log_file = Mock()
-                            mock_log_file.__str__ = Mock(return_value="test_logs/jira_batch.log")
-                            mock_logs_dir.__truediv__ = Mock(return_value=mock_log_file)
-                            
-                            setup_logging(settings, level)
-                            
-                            config_kwargs = mock_config.call_args[1]
-                            assert config_kwargs['level'] == expected
-
-    def test_setup_logging_creates_directory(self):
+        # getLevelName maps a registered level name back to its int value
+        assert logging.getLogger().level == logging.getLevelName(level)
+
+    def test_setup_logging_creates_directory(self, reset_logging):
         """Test that logs directory is created."""
-        settings = Mock()
-        settings.logs_directory = "test_logs"
+        setup_logging(reset_logging.settings, "INFO")
+        
+        assert reset_logging.logs_dir.is_dir()
+
+    def test_setup_logging_log_file_path(self, reset_logging):
+        """Test that records go to jira_batch.log inside the logs directory."""
+        setup_logging(reset_logging.settings, "DEBUG")
         
-        with patch('src.presentation.cli.commands.logging.basicConfig'):
-            with patch('src.presentation.cli.commands.Path') as mock_path_class:
-                with patch('src.presentation.cli.commands.logging.FileHandler'):
-                    with patch('src.presentation.cli.commands.logging.StreamHandler'):
-                        mock_logs_dir = Mock()
-                        mock_path_class.return_value = mock_logs_dir
-                        mock_log_file = Mock()
-                        mock_log_file.__str__ = Mock(return_value="test_logs/jira_batch.log")
-                        mock_logs_dir.__truediv__ = Mock(return_value=mock_log_file)
-                        
-                        setup_logging(settings, "INFO")
-                        
-                        # Verify directory creation
-                        mock_path_class.assert_called_once_with("test_logs")
-                        mock_logs_dir.mkdir.assert_called_once_with(exist_ok=True)
-
-    def test_setup_logging_log_file_path(self):
-        """Test that log file path is correctly constructed."""
-        settings = Mock()
-        settings.logs_directory = "custom_logs"
+        file_handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.FileHandler)]
+        assert [h.baseFilename for h in file_handlers] == [str(reset_logging.logs_dir / "jira_batch.log")]
         
-        with patch('src.presentation.cli.commands.logging.basicConfig'):
-            with patch('src.presentation.cli.commands.Path') as mock_path_class:
-                with patch('src.presentation.cli.commands.logging.FileHandler') as mock_file_handler:
-                    mock_logs_dir = Mock()
-                    mock_path_class.return_value = mock_logs_dir
-                    mock_log_file = Mock()
-                    mock_log_file.__str__ = Mock(return_value="custom_logs/jira_batch.log")
-                    mock_logs_dir.__truediv__ = Mock(return_value=mock_log_file)
-                    
-                    setup_logging(settings, "DEBUG")
-                    
-                    # Verify log file path construction
-                    mock_logs_dir.__truediv__.assert_called_once_with("jira_batch.log")
-
-    def test_setup_logging_silences_external_loggers(self):
+        logging.getLogger("historiador.test").info("hola")
+        file_handlers[0].flush()
+        assert "hola" in (reset_logging.logs_dir / "jira_batch.log").read_text(encoding="utf-8")
+
+    def test_setup_logging_silences_external_loggers(self, reset_logging):
         """Test that external loggers are silenced."""
-        settings = Mock()
-        settings.logs_directory = "test_logs"
+        setup_logging(reset_logging.settings, "INFO")
         
-        with patch('src.presentation.cli.commands.logging.basicConfig'):
-            with patch('src.presentation.cli.commands.Path') as mock_path_class:
-                with patch('src.presentation.cli.commands.logging.FileHandler'):
-                    with patch('src.presentation.cli.commands.logging.getLogger') as mock_get_logger:
-                        mock_logs_dir = Mock()
-                        mock_path_class.return_value = mock_logs_dir
-                        mock_log_file = Mock()
-                        mock_log_file.__str__ = Mock(return_value="test_logs/jira_batch.log")
-                        mock_logs_dir.__truediv__ = Mock(return_value=mock_log_file)
-                        
-                        mock_urllib3_logger = Mock()
-                        mock_requests_logger = Mock()
-                        
-                        def get_logger_side_effect(name):
-                            if name == "urllib3":
-                                return mock_urllib3_logger
-                            elif name == "requests":
-                                return mock_requests_logger
-                            return Mock()
-                        
-                        mock_get_logger.side_effect = get_logger_side_effect
-                        
-                        setup_logging(settings, "INFO")
-                        
-                        # Verify external loggers are silenced
-                        mock_urllib3_logger.setLevel.assert_called_once_with(30)  # WARNING
-                        mock_requests_logger.setLevel.assert_called_once_with(30)  # WARNING
\ No newline at end of file
+        assert logging.getLogger("urllib3").level == logging.WARNING
+        assert logging.getLogger("requests").level == logging.WARNING
+
+
+_JIRA_ENV = {
+    'JIRA_URL': 'https://test.atlassian.net',
+    'JIRA_EMAIL': 'user@example.com',
+    'JIRA_API_TOKEN': 'token',
+    'PROJECT_KEY': 'TEST',
+}
+
+_CREATEMETA_ISSUE_TYPES = {'projects': [{'issuetypes': [
+    {'id': '10', 'name': 'Story', 'subtask': False},
+    {'id': '20', 'name': 'Feature', 'subtask': False},
+    {'id': '30', 'name': 'Subtarea', 'subtask': True},
+]}]}
+
+_CREATEMETA_FIELDS = {'projects': [{'issuetypes': [
+    {'id': '10', 'name': 'Story', 'fields': {
+        'customfield_10001': {'name': 'Acceptance Criteria', 'schema': {'type': 'string'}},
+    }},
+    {'id': '20', 'name': 'Feature', 'fields': {
+        'customfield_11493': {'name': 'Backlog', 'required': True,
+                              'allowedValues': [{'id': '54672'}]},
+    }},
+]}]}
+
+
+@pytest.fixture
+def jira_session():
+    """Patch requests.Session with a mock that answers Jira endpoints by URL."""
+    def get(url, params=None, **kwargs):
+        if url.endswith('/issue/createmeta'):
+            payload = _CREATEMETA_FIELDS if 'expand' in params else _CREATEMETA_ISSUE_TYPES
+        else:
+            payload = {}
+        return Mock(status_code=200, content=json.dumps(payload).encode())
+
+    session = Mock(headers={})
+    session.get.side_effect = get
+    with patch('src.presentation.cli.commands.requests.Session', return_value=session), \
+         patch('src.presentation.cli.commands.click.echo'):
+        yield session
+
+
+class TestDetectJiraConfiguration:
+    """Test _detect_jira_configuration function."""
+
+    def test_detect_jira_configuration_request_count(self, jira_session):
+        """Test that detection reuses preloaded createmeta instead of refetching per type."""
+        config = _detect_jira_configuration(_JIRA_ENV)
+
+        assert config['DEFAULT_ISSUE_TYPE'] == 'Story'
+        assert config['FEATURE_ISSUE_TYPE'] == 'Feature'
+        assert config['ACCEPTANCE_CRITERIA_FIELD'] == 'customfield_10001'
+        assert json.loads(config['FEATURE_REQUIRED_FIELDS']) == {'customfield_11493': {'id': '54672'}}
+        # myself, project, issue types and one preload for Story and Feature
+        assert jira_session.get.call_count == 4
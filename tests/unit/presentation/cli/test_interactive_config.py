@@ -1,14 +1,62 @@
 """Tests para configuración interactiva."""
-import tempfile
 import os
-from pathlib import Path
-from unittest.mock import patch, mock_open
+from types import MappingProxyType
+from unittest.mock import patch
 import pytest
-from click.testing import CliRunner
 
 from src.presentation.cli.commands import safe_init_settings, _configure_interactively, _create_env_file
 from src.infrastructure.settings import Settings
-from pydantic import ValidationError
+
+
+# Variables de entorno con la configuración mínima válida
+VALID_ENV = MappingProxyType({
+    'JIRA_URL': 'https://test.atlassian.net',
+    'JIRA_EMAIL': 'test@test.com',
+    'JIRA_API_TOKEN': 'token123',
+    'PROJECT_KEY': 'TEST'
+})
+
+
+def _parse_env(text):
+    """Convierte el contenido de un .env en un dict, ignorando comentarios."""
+    return dict(
+        line.split('=', 1) for line in text.splitlines()
+        if '=' in line and not line.startswith('#')
+    )
+
+
+# Campos faltantes (nombre, variable de entorno) que recibe _configure_interactively
+_ALL_MISSING = (
+    ('jira_url', 'JIRA_URL'),
+    ('jira_email', 'JIRA_EMAIL'),
+    ('jira_api_token', 'JIRA_API_TOKEN'),
+    ('project_key', 'PROJECT_KEY')
+)
+_OPTIONAL_CASE = (
+    ('jira_url', 'JIRA_URL'),
+    ('acceptance_criteria_field', 'ACCEPTANCE_CRITERIA_FIELD')
+)
+
+
+# Valores mínimos para construir Settings sin leer el entorno
+_SETTINGS_DEFAULTS = MappingProxyType({
+    'jira_url': 'https://test.atlassian.net',
+    'jira_email': 'test@test.com',
+    'jira_api_token': 'token123',
+    'project_key': 'TEST'
+})
+
+
+def _make_settings(**overrides):
+    """Construye Settings a partir de valores explícitos, sin escanear os.environ ni .env."""
+    return Settings.model_validate({**_SETTINGS_DEFAULTS, **overrides})
+
+
+@pytest.fixture
+def offline_reload(monkeypatch):
+    """Evita la detección contra Jira y recarga Settings con _make_settings."""
+    monkeypatch.setattr('src.presentation.cli.commands._detect_jira_configuration', lambda env_values: None)
+    monkeypatch.setattr('src.presentation.cli.commands.Settings', _make_settings)
 
 
 class TestInteractiveConfiguration:
@@ -16,12 +64,7 @@ class TestInteractiveConfiguration:
 
     def test_safe_init_settings_with_valid_env(self):
         """Test que Settings se inicializa correctamente con .env válido."""
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@test.com',
-            'JIRA_API_TOKEN': 'token123',
-            'PROJECT_KEY': 'TEST'
-        }):
+        with patch.dict(os.environ, VALID_ENV):
             settings = safe_init_settings()
             assert isinstance(settings, Settings)
             assert settings.jira_url == 'https://test.atlassian.net'
@@ -30,15 +73,8 @@ class TestInteractiveConfiguration:
     @patch('click.prompt')
     @patch('click.echo')
     @patch('src.presentation.cli.commands._create_env_file')
-    def test_configure_interactively(self, mock_create_env, mock_echo, mock_prompt):
+    def test_configure_interactively(self, mock_create_env, mock_echo, mock_prompt, offline_reload):
         """Test configuración interactiva completa."""
-        missing_fields = [
-            ('jira_url', 'JIRA_URL'),
-            ('jira_email', 'JIRA_EMAIL'), 
-            ('jira_api_token', 'JIRA_API_TOKEN'),
-            ('project_key', 'PROJECT_KEY')
-        ]
-        
         mock_prompt.side_effect = [
             'https://test.atlassian.net',
             'test@test.com',
@@ -46,13 +82,7 @@ class TestInteractiveConfiguration:
             'TEST'
         ]
         
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@test.com',
-            'JIRA_API_TOKEN': 'secret_token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            result = _configure_interactively(missing_fields)
+        result = _configure_interactively(_ALL_MISSING)
         
         assert isinstance(result, Settings)
         mock_create_env.assert_called_once()
@@ -60,31 +90,20 @@ class TestInteractiveConfiguration:
     @patch('click.prompt')
     @patch('click.echo')
     @patch('src.presentation.cli.commands._create_env_file')
-    def test_configure_interactively_with_optional_field(self, mock_create_env, mock_echo, mock_prompt):
+    def test_configure_interactively_with_optional_field(self, mock_create_env, mock_echo, mock_prompt, offline_reload):
         """Test configuración interactiva con campo opcional."""
-        missing_fields = [
-            ('jira_url', 'JIRA_URL'),
-            ('acceptance_criteria_field', 'ACCEPTANCE_CRITERIA_FIELD')
-        ]
-        
         mock_prompt.side_effect = [
             'https://test.atlassian.net',
             ''  # Campo opcional vacío
         ]
         
-        with patch.dict(os.environ, {
-            'JIRA_URL': 'https://test.atlassian.net',
-            'JIRA_EMAIL': 'test@test.com',
-            'JIRA_API_TOKEN': 'token',
-            'PROJECT_KEY': 'TEST'
-        }):
-            _configure_interactively(missing_fields)
+        _configure_interactively(_OPTIONAL_CASE)
         
         # Verificar que el campo opcional no se pasó a _create_env_file
         call_args = mock_create_env.call_args[0][0]
         assert 'ACCEPTANCE_CRITERIA_FIELD' not in call_args
 
-    def test_create_env_file_basic(self):
+    def test_create_env_file_basic(self, tmp_path, monkeypatch):
         """Test creación básica de archivo .env."""
         env_values = {
             'JIRA_URL': 'https://test.atlassian.net',
@@ -92,27 +111,20 @@ class TestInteractiveConfiguration:
             'JIRA_API_TOKEN': 'token123',
             'PROJECT_KEY': 'TEST'
         }
+        monkeypatch.chdir(tmp_path)
+        
+        _create_env_file(env_values)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
-            
-            try:
-                _create_env_file(env_values)
-                
-                env_file = Path('.env')
-                assert env_file.exists()
-                
-                content = env_file.read_text()
-                assert 'JIRA_URL=https://test.atlassian.net' in content
-                assert 'JIRA_EMAIL=test@test.com' in content
-                assert 'PROJECT_KEY=TEST' in content
-                assert 'DEFAULT_ISSUE_TYPE=Story' in content
-                
-            finally:
-                os.chdir(original_cwd)
-
-    def test_create_env_file_with_optional_field(self):
+        env_file = tmp_path / '.env'
+        assert env_file.exists()
+        
+        env = _parse_env(env_file.read_text())
+        assert env['JIRA_URL'] == 'https://test.atlassian.net'
+        assert env['JIRA_EMAIL'] == 'test@test.com'
+        assert env['PROJECT_KEY'] == 'TEST'
+        assert env['DEFAULT_ISSUE_TYPE'] == 'Story'
+
+    def test_create_env_file_with_optional_field(self, tmp_path, monkeypatch):
         """Test creación de archivo .env con campo opcional."""
         env_values = {
             'JIRA_URL': 'https://test.atlassian.net',
@@ -121,34 +133,21 @@ class TestInteractiveConfiguration:
             'PROJECT_KEY': 'TEST',
             'ACCEPTANCE_CRITERIA_FIELD': 'customfield_10001'
         }
+        monkeypatch.chdir(tmp_path)
+        
+        _create_env_file(env_values)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
-            
-            try:
-                _create_env_file(env_values)
-                
-                content = Path('.env').read_text()
-                assert 'ACCEPTANCE_CRITERIA_FIELD=customfield_10001' in content
-                
-            finally:
-                os.chdir(original_cwd)
+        env = _parse_env((tmp_path / '.env').read_text())
+        assert env['ACCEPTANCE_CRITERIA_FIELD'] == 'customfield_10001'
 
     @patch('click.prompt')
-    def test_interactive_api_token_hidden(self, mock_prompt):
+    def test_interactive_api_token_hidden(self, mock_prompt, offline_reload):
         """Test que el API token se solicita con hide_input=True."""
         missing_fields = [('jira_api_token', 'JIRA_API_TOKEN')]
         
         mock_prompt.return_value = 'secret_token'
         
-        with patch('src.presentation.cli.commands._create_env_file'), \
-             patch.dict(os.environ, {
-                 'JIRA_URL': 'https://test.atlassian.net',
-                 'JIRA_EMAIL': 'test@test.com',
-                 'JIRA_API_TOKEN': 'secret_token',
-                 'PROJECT_KEY': 'TEST'
-             }):
+        with patch('src.presentation.cli.commands._create_env_file'):
             _configure_interactively(missing_fields)
         
         mock_prompt.assert_called_once_with('API Token de Jira', hide_input=True, type=str)
\ No newline at end of file